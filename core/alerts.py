@@ -28,13 +28,16 @@ def ensure_alerts_dir(task_name):
     return alerts_dir
 
 
-def check_alert_patterns(task_name, task_config, output):
+def check_alert_patterns(task_name, task_config, output, compiled_patterns=None):
     """Check task output against alert patterns and record any matches.
 
     Args:
         task_name: Name of the task
         task_config: Task configuration dict
-        output: The stdout/stderr output to check
+        output: The output to check, as one string or a list of strings
+            (e.g. [stdout, stderr]) searched separately
+        compiled_patterns: Optional list of (compiled_pattern, alert) pairs
+            precompiled at config load; built from task_config if omitted
 
     Returns:
         list: List of triggered alerts (dicts with pattern, message, severity)
@@ -43,14 +46,18 @@ def check_alert_patterns(task_name, task_config, output):
     if not alerts:
         return []
 
+    if compiled_patterns is None:
+        compiled_patterns = [(re.compile(alert["pattern"]), alert) for alert in alerts if alert.get("pattern")]
+
+    # Searching each stream separately avoids building a joined copy of the output
+    streams = [output] if isinstance(output, str) else output
+
     triggered = []
-    for alert in alerts:
-        pattern = alert.get("pattern")
-        if not pattern:
-            continue
+    for regex, alert in compiled_patterns:
+        pattern = alert["pattern"]
 
         # Check if pattern matches
-        if re.search(pattern, output):
+        if any(regex.search(stream) for stream in streams):
             triggered.append(
                 {
                     "pattern": pattern,
@@ -59,7 +66,7 @@ def check_alert_patterns(task_name, task_config, output):
                     "title": alert.get("title"),
                     "notify": alert.get("notify"),  # Per-alert override for notification
                     "on_failure_only": alert.get("on_failure_only"),  # Per-alert override
-                    "timestamp": format_timestamp(datetime.now()),
+                    "timestamp": format_timestamp(),
                     "task_name": task_name,
                 }
             )
@@ -1,15 +1,22 @@
 # CLI command definitions for signalbox
-import importlib.metadata
 from datetime import datetime
 import os
 import sys
 import shutil
 import yaml
+from collections import defaultdict
 from functools import wraps
+from itertools import islice
 import click
 
 from .config import load_config, get_config_value, load_global_config, _default_config_manager
-from .executor import run_task, run_group_parallel, run_group_serial
+from .executor import (
+    run_task,
+    run_group_parallel,
+    run_group_serial,
+    snapshot_execution_settings,
+    validate_and_reload_config,
+)
 from .runtime import save_group_runtime_state, load_runtime_state, merge_config_with_runtime_state
 from . import log_manager
 from . import validator
@@ -17,7 +24,7 @@ from . import exporters
 from . import notifications
 from . import alerts
 from .exceptions import SignalboxError, TaskNotFoundError, GroupNotFoundError, ValidationError, ConfigurationError
-from .helpers import format_timestamp, parse_timestamp
+from .helpers import format_timestamp, parse_timestamp, get_timestamp_format, YAML_DUMPER
 def handle_exceptions(func):
     """Decorator to handle exceptions consistently across CLI commands with proper exit codes."""
 
@@ -46,6 +53,34 @@ def handle_exceptions(func):
 
     return wrapper
 
+
+def _find_task(config, name):
+    """Look up a task by name, via the load-time index when present."""
+    tasks_by_name = config.get("_tasks_by_name")
+    if tasks_by_name is not None:
+        return tasks_by_name.get(name)
+    return next((t for t in config["tasks"] if t["name"] == name), None)
+
+
+def _find_group(config, name):
+    """Look up a group by name, via the load-time index when present."""
+    groups_by_name = config.get("_groups_by_name")
+    if groups_by_name is not None:
+        return groups_by_name.get(name)
+    return next((g for g in config.get("groups", []) if g["name"] == name), None)
+
+
+def _quiet_config_warnings():
+    """Suppress YAML load warnings for this process, including in nested reloads during task runs."""
+    os.environ["SIGNALBOX_SUPPRESS_CONFIG_WARNINGS"] = "1"
+
+
+def _load_quiet_config():
+    """Load config with YAML load warnings suppressed, including in nested reloads during task runs."""
+    _quiet_config_warnings()
+    return load_config(suppress_warnings=True)
+
+
 @click.group(
     help="""
 Signalbox - Task automation and monitoring.
@@ -68,17 +103,16 @@ Run 'signalbox COMMAND --help' for more information on a command.
 """
 )
 @click.option("--config", "-c", "config_path", default=None, help="Path to custom signalbox.yaml config file")
-@click.version_option(importlib.metadata.version("signalbox"), "--version", "-V", message="%(version)s")
+# package_name defers the installed-metadata lookup until --version is actually passed
+@click.version_option(None, "--version", "-V", package_name="signalbox", message="%(version)s")
 def cli(config_path):
     """Signalbox - Task execution control and monitoring."""
     if config_path:
         # Set config home to the directory containing the custom config file
-        import os
-
         config_dir = os.path.dirname(os.path.abspath(config_path))
+        # Drop cached config and resolved paths so they reload from the new home
+        _default_config_manager.reset()
         _default_config_manager._config_home = config_dir
-        # Optionally, reset cached config so it reloads
-        _default_config_manager._global_config = None
 
 
 # ============================================================================
@@ -183,8 +217,9 @@ def init():
             pass
 
     if os.path.exists(template_config):
-        # Copy the entire config directory
-        shutil.copytree(template_config, os.path.join(config_dir, "config"))
+        # Copy the entire config directory. Plain copyfile skips the per-file
+        # copystat (chmod/utime) syscalls that copy2 would add for templates.
+        shutil.copytree(template_config, os.path.join(config_dir, "config"), copy_function=shutil.copyfile)
         click.echo(f"✓ Created configuration directory: {config_dir}")
         click.echo(f"✓ Copied default config from: {template_config}")
     else:
@@ -196,9 +231,8 @@ def init():
         sys.exit(1)
 
     # Create logs and runtime directories
-    os.makedirs(os.path.join(config_dir, "logs"), exist_ok=True)
-    os.makedirs(os.path.join(config_dir, "runtime/tasks"), exist_ok=True)
-    os.makedirs(os.path.join(config_dir, "runtime/groups"), exist_ok=True)
+    for subdir in ("logs", "runtime/tasks", "runtime/groups"):
+        os.makedirs(os.path.join(config_dir, subdir), exist_ok=True)
 
     click.echo(f"✓ Created logs directory: {config_dir}/logs")
     click.echo(f"✓ Created runtime directory: {config_dir}/runtime")
@@ -220,8 +254,7 @@ def init():
 @handle_exceptions
 def run_shortcut(name):
     """Run a task (shortcut to 'task run <name>')."""
-    os.environ["SIGNALBOX_SUPPRESS_CONFIG_WARNINGS"] = "1"
-    config = load_config(suppress_warnings=True)
+    config = _load_quiet_config()
     run_task(name, config)
 
 
@@ -255,44 +288,35 @@ def task_list():
     config = merge_config_with_runtime_state(config, runtime_state)
 
     date_format = get_config_value("display.date_format", "%Y-%m-%d %H:%M:%S")
+    timestamp_format = get_timestamp_format()
     # Group tasks by their source file
-    task_sources = config.get("_task_sources", {})
-    tasks_by_file = {}
+    task_source = config.get("_task_sources", {}).get
+    tasks_by_file = defaultdict(list)
     for task in config["tasks"]:
-        source = task_sources.get(task.get("name"), "<unknown source>")
-        tasks_by_file.setdefault(source, []).append(task)
-
-    import os
+        tasks_by_file[task_source(task.get("name"), "<unknown source>")].append(task)
 
     # Flatten all tasks with their source file for a single table
     from core.cli_output import print_task_list_table
+    from core.cli_output_common import TaskRow
     all_rows = []
     for source_file, tasks in tasks_by_file.items():
         file_name = os.path.basename(source_file)
         for task in tasks:
             try:
                 name = task.get("name", "")
-                status = task.get("last_status", "not run")
+                # Runtime YAML yields a fresh string per task; intern so repeated
+                # statuses share one object and the printer's style lookup hits by identity
+                status = sys.intern(str(task.get("last_status", "not run")))
                 last_run = task.get("last_run", "")
                 description = task.get("description", "")
                 source = file_name
                 # Format last run
                 if last_run:
-                    try:
-                        timestamp_str = last_run.replace(".log", "")
-                        dt = parse_timestamp(timestamp_str)
-                        last_run_str = dt.strftime(date_format)
-                    except Exception:
-                        last_run_str = last_run
+                    dt = parse_timestamp(str(last_run), timestamp_format)
+                    last_run_str = dt.strftime(date_format) if dt else last_run
                 else:
                     last_run_str = ""
-                all_rows.append({
-                    "name": name,
-                    "status": status,
-                    "last_run": last_run_str,
-                    "description": description,
-                    "source": source,
-                })
+                all_rows.append(TaskRow(name, status, last_run_str, description, source))
             except KeyError as e:
                 click.echo(f"[CONFIG ERROR] Task entry missing required field: {e}. Offending task: {task}", err=True)
             except Exception as e:
@@ -307,23 +331,24 @@ def task_list():
 def task_run(name, run_all_tasks):
     """Run a single task or all tasks."""
     if run_all_tasks:
-        import os
-        os.environ["SIGNALBOX_SUPPRESS_CONFIG_WARNINGS"] = "1"
-        config = load_config(suppress_warnings=True)
+        _quiet_config_warnings()
         click.echo("Running all tasks...")
         from core.cli_output_run import print_task_run_table
+        from core.cli_output_common import RunResultRow
         results = []
+        # Validation reloads the config, so this is the only load for the run
+        config = validate_and_reload_config()
+        settings = snapshot_execution_settings()
         for task_item in config["tasks"]:
             name = task_item["name"]
             log_file = ""
             error = ""
             try:
                 click.echo(f"Running {name}...")
-                success = run_task(name, config)
+                success = run_task(name, config, settings, skip_validation=True)
                 status = "success" if success else "failed"
                 # Find log file
-                log_dir = config.get("paths", {}).get("log_dir", "logs")
-                log_path = os.path.join(log_dir, name)
+                log_path = log_manager.get_task_log_dir(name)
                 log_files = sorted([f for f in os.listdir(log_path) if f.endswith(".log")], reverse=True)
                 log_file = log_files[0] if log_files else ""
             except SignalboxError as e:
@@ -332,14 +357,9 @@ def task_run(name, run_all_tasks):
             except Exception as e:
                 status = "failed"
                 error = str(e)
-            results.append({
-                "name": name,
-                "status": status,
-                "log_file": log_file,
-                "error": error,
-            })
+            results.append(RunResultRow(name, status, log_file, error))
         print_task_run_table(results)
-        failed_tasks = [r["name"] for r in results if r["status"] != "success"]
+        failed_tasks = [r.name for r in results if r.status != "success"]
         if failed_tasks:
             click.echo(f"\n{len(failed_tasks)} task(s) failed: {', '.join(failed_tasks)}", err=True)
             sys.exit(1)
@@ -347,9 +367,7 @@ def task_run(name, run_all_tasks):
             click.echo("\nAll tasks completed successfully")
             sys.exit(0)
     elif name:
-        import os
-        os.environ["SIGNALBOX_SUPPRESS_CONFIG_WARNINGS"] = "1"
-        config = load_config(suppress_warnings=True)
+        config = _load_quiet_config()
         success = run_task(name, config)
         if not success:
             sys.exit(1)
@@ -368,9 +386,9 @@ def task_run(name, run_all_tasks):
 @handle_exceptions
 def group_run(name):
     """Run a group of tasks."""
-    config = load_config()
-    groups = config.get("groups", [])
-    group = next((g for g in groups if g["name"] == name), None)
+    # Validation reloads the config, so this is the only load for the run
+    config = validate_and_reload_config()
+    group = _find_group(config, name)
     if not group:
         raise GroupNotFoundError(name)
     execution_mode = group.get("execution", "serial")
@@ -384,19 +402,27 @@ def group_run(name):
     start_time = datetime.now()
     timestamp = format_timestamp(start_time)
     from core.cli_output_run import print_group_run_table
+    from core.cli_output_common import RunResultRow
+    # Hand the whole group over at once, so parallel tasks actually run
+    # concurrently and a serial group's stop_on_error can skip the rest
+    group_results = []
+    if execution_mode == "parallel":
+        run_group_parallel(task_names, config, results=group_results)
+    else:
+        run_group_serial(task_names, config, stop_on_error, results=group_results)
+    outcomes = {task_name: (success, error) for task_name, success, error in group_results}
     results = []
     for task_name in task_names:
         log_file = ""
         error = ""
+        if task_name not in outcomes:
+            results.append(RunResultRow(task_name, "skipped", "", "not run (stop_on_error)"))
+            continue
         try:
-            click.echo(f"Running {task_name}...")
-            if execution_mode == "parallel":
-                success = run_group_parallel([task_name], config)
-            else:
-                success = run_group_serial([task_name], config, stop_on_error)
+            success, task_error = outcomes[task_name]
+            error = task_error or ""
             status = "success" if success else "failed"
-            log_dir = config.get("paths", {}).get("log_dir", "logs")
-            log_path = os.path.join(log_dir, task_name)
+            log_path = log_manager.get_task_log_dir(task_name)
             log_files = sorted([f for f in os.listdir(log_path) if f.endswith(".log")], reverse=True)
             log_file = log_files[0] if log_files else ""
         except SignalboxError as e:
@@ -405,16 +431,11 @@ def group_run(name):
         except Exception as e:
             status = "failed"
             error = str(e)
-        results.append({
-            "name": task_name,
-            "status": status,
-            "log_file": log_file,
-            "error": error,
-        })
+        results.append(RunResultRow(task_name, status, log_file, error))
     end_time = datetime.now()
     execution_time = (end_time - start_time).total_seconds()
     tasks_total = len(task_names)
-    tasks_successful = sum(1 for r in results if r["status"] == "success")
+    tasks_successful = sum(1 for r in results if r.status == "success")
     if tasks_successful == tasks_total:
         group_status = "success"
     elif tasks_successful > 0:
@@ -449,7 +470,7 @@ def group_run(name):
 def log_show(name):
     """Show the latest log for a task."""
     config = load_config()
-    task = next((t for t in config["tasks"] if t["name"] == name), None)
+    task = _find_task(config, name)
     if not task:
         raise TaskNotFoundError(name)
 
@@ -466,14 +487,14 @@ def log_show(name):
         click.echo(f"Log file: {log_path}")
         click.echo("=" * 50)
 
-    content = log_manager.read_log_content(log_path)
-    formatted_lines = log_manager.format_log_with_colors(content, show_colors)
-
-    for line, color in formatted_lines:
-        if color:
-            click.echo(click.style(line, fg=color))
-        else:
-            click.echo(line)
+    # Stream the log and emit it in batches of lines: a handful of writes
+    # instead of one per line, without holding a large log in memory
+    formatted_lines = log_manager.iter_log_with_colors(log_manager.iter_log_lines(log_path), show_colors)
+    while True:
+        batch = [click.style(line, fg=color) if color else line for line, color in islice(formatted_lines, 1000)]
+        if not batch:
+            break
+        click.echo("\n".join(batch))
 
 
 @log.command(name="history")
@@ -482,7 +503,7 @@ def log_show(name):
 def log_history_cmd(name):
     """Show all historical log files for a task."""
     config = load_config()
-    task = next((t for t in config["tasks"] if t["name"] == name), None)
+    task = _find_task(config, name)
     if not task:
         raise TaskNotFoundError(name)
 
@@ -497,11 +518,11 @@ def log_history_cmd(name):
 
     task_log_dir = log_manager.get_task_log_dir(name)
     path_info = f" ({task_log_dir})" if include_paths else ""
-    click.echo(f"Log history for {name}{path_info}:")
-
+    lines = [f"Log history for {name}{path_info}:"]
     for filename, mtime in log_info:
         time_str = datetime.fromtimestamp(mtime).strftime(date_format)
-        click.echo(f"  {filename} - {time_str}")
+        lines.append(f"  {filename} - {time_str}")
+    click.echo("\n".join(lines))
 
 
 @log.command(name="list")
@@ -569,16 +590,17 @@ def log_list_cmd(task, status, failed, success, since, until, today, limit):
     
     # Table output using rich
     from core.cli_output_tables import print_log_list_table
+    from core.cli_output_common import LogRow
     date_format = get_config_value("display.date_format", "%Y-%m-%d %H:%M:%S")
     log_rows = []
     for log in filtered_logs:
         try:
-            log_rows.append({
-                "task": log["task"],
-                "status": log["metadata"]["status"],
-                "timestamp": log["timestamp"].strftime(date_format),
-                "log_file": log["log_file"],
-            })
+            log_rows.append(LogRow(
+                log["task"],
+                log["metadata"]["status"],
+                log["timestamp"].strftime(date_format),
+                log["log_file"],
+            ))
         except Exception as e:
             click.echo(f"[LOG ERROR] {e} in log: {log}", err=True)
     print_log_list_table(log_rows)
@@ -596,7 +618,7 @@ def log_tail_cmd(name, follow, lines):
     import subprocess
     
     config = load_config()
-    task = next((t for t in config["tasks"] if t["name"] == name), None)
+    task = _find_task(config, name)
     if not task:
         raise TaskNotFoundError(name)
     
@@ -659,7 +681,7 @@ def log_clear(task_name, clear_all):
             click.echo("No logs directory found")
     elif task_name:
         config = load_config()
-        task = next((t for t in config["tasks"] if t["name"] == task_name), None)
+        task = _find_task(config, task_name)
         if not task:
             raise TaskNotFoundError(task_name)
         if log_manager.clear_task_logs(task_name):
@@ -723,7 +745,7 @@ def config_show(key):
             return
 
         click.echo("Global Configuration (config/signalbox.yaml):\n")
-        click.echo(yaml.dump(global_config, default_flow_style=False, sort_keys=False))
+        click.echo(yaml.dump(global_config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False))
 
 
 @config.command(name="path")
@@ -746,6 +768,7 @@ def list_schedules():
         return
 
     from core.cli_output_tables import print_schedule_list_table
+    from core.cli_output_common import ScheduleRow
     schedule_rows = []
     for group in scheduled:
         # Ensure all values are strings for rich table rendering
@@ -758,13 +781,7 @@ def list_schedules():
         else:
             tasks_str = str(tasks_list)
         task_count = str(len(tasks_list)) if isinstance(tasks_list, (list, tuple)) else "1"
-        schedule_rows.append({
-            "group": group_name,
-            "schedule": schedule,
-            "description": description,
-            "task_count": task_count,
-            "tasks": tasks_str,
-        })
+        schedule_rows.append(ScheduleRow(group_name, schedule, description, task_count, tasks_str))
     print_schedule_list_table(schedule_rows)
 
 
@@ -774,8 +791,7 @@ def list_schedules():
 def export_systemd(group_name, user):
     """Generate systemd service and timer files for a scheduled group."""
     config = load_config()
-    groups = config.get("groups", [])
-    group = next((g for g in groups if g["name"] == group_name), None)
+    group = _find_group(config, group_name)
 
     result = exporters.export_systemd(group, group_name)
 
@@ -799,8 +815,7 @@ def export_systemd(group_name, user):
 def export_cron(group_name):
     """Generate crontab entry for a scheduled group."""
     config = load_config()
-    groups = config.get("groups", [])
-    group = next((g for g in groups if g["name"] == group_name), None)
+    group = _find_group(config, group_name)
 
     result = exporters.export_cron(group, group_name)
 
@@ -906,9 +921,7 @@ def config_validate():
 @handle_exceptions
 def notify_test(title, message, urgency):
     """Send a test notification to verify notification system works."""
-    import platform
-
-    system = platform.system()
+    system = notifications.get_system()
     click.echo(f"Sending test notification on {system}...")
     click.echo(f"Title: {title}")
     click.echo(f"Message: {message}")
@@ -945,6 +958,7 @@ def alerts_cmd(task_name, severity, days):
     # Display alerts
     date_format = get_config_value("display.date_format", "%Y-%m-%d %H:%M:%S")
 
+    lines = []
     for alert in alert_list:
         try:
             timestamp_str = alert.get("timestamp", "")
@@ -965,10 +979,11 @@ def alerts_cmd(task_name, severity, days):
         else:
             severity_label = click.style(severity_str, fg="blue")
 
-        click.echo(f"[{human_date}] [{severity_label}] {task}: {message}")
+        lines.append(f"[{human_date}] [{severity_label}] {task}: {message}")
 
-    # Show summary
-    click.echo(f"\nTotal alerts: {len(alert_list)}")
+    # Show alerts and summary with a single write
+    lines.append(f"\nTotal alerts: {len(alert_list)}")
+    click.echo("\n".join(lines))
 
 
 # Register the alerts command with the CLI group
@@ -0,0 +1,94 @@
+from collections import namedtuple
+from operator import attrgetter, itemgetter
+
+from rich.console import Console
+from rich.table import Table
+
+# Shared by all table printers so terminal detection happens once per process
+CONSOLE = Console()
+
+# Row types for the table printers; field order matches each printer's columns
+TaskRow = namedtuple("TaskRow", "name status last_run description source")
+RunResultRow = namedtuple("RunResultRow", "name status log_file error")
+LogRow = namedtuple("LogRow", "task status timestamp log_file")
+GroupRow = namedtuple("GroupRow", "name description schedule execution tasks")
+ScheduleRow = namedtuple("ScheduleRow", "group schedule description task_count tasks")
+
+STATUS_STYLE = {
+    "success": "green",
+    "ok": "green",
+    "failed": "red",
+    "fail": "red",
+    "error": "red",
+}
+DEFAULT_STATUS_STYLE = "yellow"
+# Opening/closing Rich markup tags per style, built once
+STATUS_TAGS = {style: (f"[{style}]", f"[/{style}]") for style in ("green", "red", "yellow")}
+# Fully wrapped markup for the known status values, keyed by the exact cell text
+WRAPPED_STATUS = {status: f"[{style}]{status}[/{style}]" for status, style in STATUS_STYLE.items()}
+
+
+# Above this many rows, column widths are fixed from the cell text lengths so
+# Rich skips measuring every cell before printing, provided they fit the console
+FIXED_WIDTH_MIN_ROWS = 500
+
+
+def _new_table(columns):
+    table = Table(header_style="bold magenta")
+    for header, style, justify, overflow, _ in columns:
+        options = {}
+        if justify:
+            options["justify"] = justify
+        if overflow:
+            options["overflow"] = overflow
+        table.add_column(header, style=style, **options)
+    return table
+
+
+def render_status_table(columns, rows, status_key="status"):
+    """
+    Print a table of rows using rich.
+    columns: list of (header, style, justify, overflow, key) tuples; justify/overflow may be None
+    rows: list of namedtuples (see TaskRow etc.) or dicts; None values render as empty
+          cells and the status_key cell is colored
+    """
+    table = _new_table(columns)
+    keys = tuple(column[4] for column in columns)
+
+    # Pick the row accessor once from the first row rather than per row
+    first = rows[0] if rows else None
+    if isinstance(first, tuple) and getattr(first, "_fields", None) == keys:
+        # Namedtuple already laid out in column order: the row is its cells
+        get_cells = None
+    elif isinstance(first, tuple):
+        get_cells = attrgetter(*keys) if len(keys) > 1 else (lambda row: (getattr(row, keys[0]),))
+    else:
+        # Fetch every cell of a row in one C-level call instead of a dict lookup per column
+        get_cells = itemgetter(*keys) if len(keys) > 1 else (lambda row: (row[keys[0]],))
+    status_index = keys.index(status_key) if status_key in keys else -1
+    # Widest text per column, tracked only for tables large enough to fix widths
+    widths = [len(column[0]) for column in columns] if len(rows) > FIXED_WIDTH_MIN_ROWS else None
+    # All rows go into one table so Rich sizes the columns once for the whole listing
+    for row in rows:
+        cells = ["" if value is None else value if isinstance(value, str) else str(value)
+                 for value in (row if get_cells is None else get_cells(row))]
+        if widths is not None:
+            for index, cell in enumerate(cells):
+                if len(cell) > widths[index]:
+                    widths[index] = len(cell)
+        if status_index >= 0:
+            status = cells[status_index]
+            wrapped = WRAPPED_STATUS.get(status)
+            if wrapped is None:
+                open_tag, close_tag = STATUS_TAGS[STATUS_STYLE.get(status.lower(), DEFAULT_STATUS_STYLE)]
+                wrapped = open_tag + status + close_tag
+            cells[status_index] = wrapped
+        table.add_row(*cells)
+    # Each column adds one space of padding either side plus a border, and the
+    # table has one more border at the edge
+    if widths is not None and sum(widths) + 3 * len(widths) + 1 <= CONSOLE.width:
+        for column, width in zip(table.columns, widths):
+            column.width = width
+    # Too wide to fit as is: let Rich measure, so the fold columns give way
+    # instead of every column shrinking in proportion
+    CONSOLE.print(table)
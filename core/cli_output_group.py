@@ -1,5 +1,12 @@
-from rich.table import Table
-from rich.console import Console
+from .cli_output_common import GroupRow, render_status_table
+
+GROUP_LIST_COLUMNS = [
+    ("GROUP", "bold", None, "fold", "name"),
+    ("DESCRIPTION", "", None, "fold", "description"),
+    ("SCHEDULE", "dim", None, "fold", "schedule"),
+    ("EXECUTION", "", "center", None, "execution"),
+    ("TASKS", "", None, "fold", "tasks"),
+]
 
 def get_schedule_display(schedule):
     """Extract schedule string for display.
@@ -8,6 +15,14 @@ def get_schedule_display(schedule):
     - String: "0 * * * *"
     - Dict: {"cron": "0 * * * *"}
     """
+    # Exact type checks: YAML only produces plain dicts and strs here
+    schedule_type = type(schedule)
+    if schedule_type is str:
+        return schedule
+    if schedule_type is dict:
+        return schedule.get("cron", "")
+    if schedule is None:
+        return ""
     if isinstance(schedule, dict):
         return schedule.get("cron", "")
     return schedule or ""
@@ -17,31 +32,28 @@ def print_group_list_table(group_rows):
     Print a table of groups using rich.
     group_rows: list of dicts with keys: name, description, schedule, execution, stop_on_error, tasks
     """
-    console = Console()
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("GROUP", style="bold", overflow="fold")
-    table.add_column("DESCRIPTION", style="", overflow="fold")
-    table.add_column("SCHEDULE", style="dim", overflow="fold")
-    table.add_column("EXECUTION", style="", justify="center")
-    table.add_column("TASKS", style="", overflow="fold")
-
+    display_rows = []
+    schedule_display = get_schedule_display
     for row in group_rows:
-        schedule = get_schedule_display(row["schedule"])
         execution = row["execution"]
         if row["stop_on_error"]:
             execution += ", stop_on_error"
         # Ensure tasks is a list of strings
         tasks_list = row["tasks"]
         if isinstance(tasks_list, list):
-            # Filter out non-strings and convert to strings
-            tasks = ", ".join([str(t) for t in tasks_list if isinstance(t, (str, int, float))])
+            try:
+                # Task lists are normally all names already; join fails fast otherwise
+                tasks = ", ".join(tasks_list)
+            except TypeError:
+                # Filter out non-strings and convert to strings
+                tasks = ", ".join([str(t) for t in tasks_list if isinstance(t, (str, int, float))])
         else:
             tasks = str(tasks_list) if tasks_list else ""
-        table.add_row(
+        display_rows.append(GroupRow(
             row["name"],
             row["description"],
-            schedule,
+            schedule_display(row["schedule"]),
             execution,
             tasks,
-        )
-    console.print(table)
+        ))
+    render_status_table(GROUP_LIST_COLUMNS, display_rows, status_key=None)
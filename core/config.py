@@ -1,11 +1,80 @@
 # Configuration management for signalbox
+import json
 import os
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import yaml
-from .helpers import load_yaml_files_from_dir
+from .helpers import iter_yaml_files_from_dir, load_yaml_file, write_yaml_file_atomic, MTIME_TICK_NS, YAML_LOADER
 
 CONFIG_FILE = "config/signalbox.yaml"
 TASKS_FILE = "tasks.yaml"
 GROUPS_FILE = "groups.yaml"
+CONFIG_CACHE_FILE = ".cache/config.json"
+# Bump whenever the cached layout changes so older caches are ignored
+CONFIG_CACHE_VERSION = 1
+# Only the parsed YAML data is cached; everything else is rebuilt from it
+_CACHED_KEYS = ("tasks", "groups", "_task_sources", "_group_sources")
+
+# Marks a dotted path that is absent from the global config
+_MISSING = object()
+
+
+def _compile_alert_patterns(tasks_by_name):
+    """Precompile each task's alert regexes once per config load.
+
+    Returns a {task_name: [(compiled_pattern, alert), ...]} map. The compiled
+    patterns live beside the tasks rather than inside them so save_config
+    never tries to write them back out. A task with an invalid pattern is
+    left out, so the error still surfaces when the task runs.
+    """
+    compiled = {}
+    for name, task in tasks_by_name.items():
+        task_alerts = task.get("alerts")
+        if not task_alerts or not isinstance(task_alerts, list):
+            continue
+        try:
+            compiled[name] = [
+                (re.compile(alert["pattern"]), alert)
+                for alert in task_alerts
+                if isinstance(alert, dict) and alert.get("pattern")
+            ]
+        except (re.error, TypeError):
+            continue
+    return compiled
+
+
+def _flatten_config(config, prefix="", flat=None):
+    """Map every dotted path in a nested config dict to its value.
+
+    Intermediate dicts are included too, so 'execution' and
+    'execution.default_timeout' both resolve. Keys that are not strings or that
+    contain a dot can never be reached by splitting a path, so they are skipped.
+    """
+    if flat is None:
+        flat = {}
+    if isinstance(config, dict):
+        for key, value in config.items():
+            if not isinstance(key, str) or "." in key:
+                continue
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, dict):
+                _flatten_config(value, path + ".", flat)
+    return flat
+
+
+def _index_config(config):
+    """Add the name indexes and compiled alert patterns derived from the loaded items."""
+    # Name indexes for O(1) lookups; the first definition of a name wins, like a linear scan
+    for key, index_key in (("tasks", "_tasks_by_name"), ("groups", "_groups_by_name")):
+        index = config[index_key] = {}
+        for item in config[key]:
+            index.setdefault(item.get("name"), item)
+    config["_alert_patterns"] = _compile_alert_patterns(config["_tasks_by_name"])
+    return config
 
 
 class ConfigManager:
@@ -29,6 +98,11 @@ class ConfigManager:
         """
         self._config_home = config_home
         self._global_config = None
+        self._flat_config = {}
+        self._flat_source = None
+        self._resolved_paths = {}
+        self._resolved_paths_home = None
+        self._load_lock = threading.Lock()
 
     def find_config_home(self):
         """
@@ -83,143 +157,244 @@ class ConfigManager:
         if os.path.isabs(path):
             return path
         config_home = self.find_config_home()
-        return os.path.join(config_home, path)
+        if config_home != self._resolved_paths_home:
+            self._resolved_paths = {}
+            self._resolved_paths_home = config_home
+        resolved = self._resolved_paths.get(path)
+        if resolved is None:
+            resolved = os.path.join(config_home, path)
+            self._resolved_paths[path] = resolved
+        return resolved
 
     def load_global_config(self):
         """Load global configuration settings from config/signalbox.yaml."""
-        if self._global_config is None:
-            config_file = self.resolve_path(CONFIG_FILE)
-            if os.path.exists(config_file):
-                with open(config_file, "r") as f:
-                    self._global_config = yaml.safe_load(f) or {}
-            else:
-                self._global_config = {}
-        return self._global_config
+        config = self._global_config
+        if config is not None:
+            return config
+        # Threads (e.g. parallel group runs) may race here; only one reads the file
+        with self._load_lock:
+            if self._global_config is None:
+                config_file = self.resolve_path(CONFIG_FILE)
+                if os.path.exists(config_file):
+                    with open(config_file, "rb", buffering=0) as f:
+                        self._global_config = yaml.load(f.read(), Loader=YAML_LOADER) or {}
+                else:
+                    self._global_config = {}
+            return self._global_config
 
     def get_config_value(self, path, default=None):
         """Get a configuration value using dot notation (e.g., 'execution.default_timeout')."""
         config = self.load_global_config()
-        keys = path.split(".")
-        value = config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        # The flat map is only valid for the config dict it was built from
+        if config is not self._flat_source:
+            self._flat_config = _flatten_config(config)
+            self._flat_source = config
+        value = self._flat_config.get(path, _MISSING)
+        return default if value is _MISSING else value
 
-    def load_config(self, suppress_warnings=False):
-
-        """Load configuration from tasks and groups directories."""
-        config = {"tasks": [], "groups": [], "_task_sources": {}, "_group_sources": {}}
+    def _config_paths(self):
+        """Resolve the task and group source directories once.
 
+        Catalog entries are None when include_catalog is disabled.
+        """
+        include_catalog = self.get_config_value("include_catalog", True)
+        return {
+            "tasks": self.resolve_path(self.get_config_value("paths.tasks_file", TASKS_FILE)),
+            "groups": self.resolve_path(self.get_config_value("paths.groups_file", GROUPS_FILE)),
+            "catalog_tasks": self.resolve_path(
+                self.get_config_value("paths.catalog_tasks_file", "config/catalog/tasks")
+            ) if include_catalog else None,
+            "catalog_groups": self.resolve_path(
+                self.get_config_value("paths.catalog_groups_file", "config/catalog/groups")
+            ) if include_catalog else None,
+        }
 
-        # Load user tasks from directory (only 'tasks_file' config key supported)
-        user_tasks_dir = self.get_config_value("paths.tasks_file", TASKS_FILE)
-        user_tasks_dir = self.resolve_path(user_tasks_dir)
-        if os.path.isdir(user_tasks_dir):
-            tasks_list = load_yaml_files_from_dir(
-                user_tasks_dir, key="tasks", track_sources=True, suppress_warnings=suppress_warnings
-            )
-            for item in tasks_list:
-                task_name = item["data"].get("name")
-                if task_name:
-                    config["_task_sources"][task_name] = item["source"]
-                config["tasks"].append(item["data"])
+    def load_config(self, suppress_warnings=False):
+        """Load configuration from tasks and groups directories.
 
-        # Load catalog tasks if enabled
-        include_catalog = self.get_config_value("include_catalog", True)
-        if include_catalog:
-            catalog_tasks_path = self.get_config_value("paths.catalog_tasks_file", "config/catalog/tasks")
-            catalog_tasks_path = self.resolve_path(catalog_tasks_path)
-            if os.path.isdir(catalog_tasks_path):
-                catalog_tasks_list = load_yaml_files_from_dir(
-                    catalog_tasks_path, key="tasks", track_sources=True, suppress_warnings=suppress_warnings
-                )
-                for item in catalog_tasks_list:
-                    task_name = item["data"].get("name")
-                    if task_name:
-                        config["_task_sources"][task_name] = item["source"]
-                    config["tasks"].append(item["data"])
-
-        # Load user groups from directory
-        groups_path = self.get_config_value("paths.groups_file", GROUPS_FILE)
-        groups_path = self.resolve_path(groups_path)
-        if os.path.isdir(groups_path):
-            groups_list = load_yaml_files_from_dir(
-                groups_path, key="groups", track_sources=True, suppress_warnings=suppress_warnings
-            )
-            for item in groups_list:
-                group_name = item["data"].get("name")
-                if group_name:
-                    config["_group_sources"][group_name] = item["source"]
-                config["groups"].append(item["data"])
-
-        # Load catalog groups if enabled
-        if include_catalog:
-            catalog_groups_path = self.get_config_value("paths.catalog_groups_file", "config/catalog/groups")
-            catalog_groups_path = self.resolve_path(catalog_groups_path)
-            if os.path.isdir(catalog_groups_path):
-                catalog_groups_list = load_yaml_files_from_dir(
-                    catalog_groups_path, key="groups", track_sources=True, suppress_warnings=suppress_warnings
-                )
-                for item in catalog_groups_list:
-                    group_name = item["data"].get("name")
-                    if group_name:
-                        config["_group_sources"][group_name] = item["source"]
-                    config["groups"].append(item["data"])
+        The parsed items are cached as JSON under CONFIG_CACHE_FILE and reused
+        while the global config and every source YAML file are unchanged.
+        """
+        paths = self._config_paths()
+        # Source directories in load order: (path, key, sources_key)
+        sources = [
+            (paths["tasks"], "tasks", "_task_sources"),
+            (paths["catalog_tasks"], "tasks", "_task_sources"),
+            (paths["groups"], "groups", "_group_sources"),
+            (paths["catalog_groups"], "groups", "_group_sources"),
+        ]
+        sources = [source for source in sources if source[0] is not None]
+
+        scan_started = time.time_ns()
+        fingerprint = self._config_fingerprint([path for path, _, _ in sources])
+        cached = self._read_config_cache(fingerprint)
+        if cached is not None:
+            return cached
 
+        config = {"tasks": [], "groups": [], "_task_sources": {}, "_group_sources": {}}
+        load_errors = []
+        sources = [source for source in sources if os.path.isdir(source[0])]
+
+        def load_source(source):
+            path, key, _ = source
+            # One (filepath, items) pair per file; the parsed lists are merged as-is
+            return list(iter_yaml_files_from_dir(
+                path, key=key, suppress_warnings=suppress_warnings, errors=load_errors
+            ))
+
+        # Read the directories concurrently; map() keeps results in load order
+        with ThreadPoolExecutor(max_workers=max(len(sources), 1)) as pool:
+            loaded = list(pool.map(load_source, sources))
+
+        for (_, key, sources_key), files in zip(sources, loaded):
+            item_sources = config[sources_key]
+            for filepath, items in files:
+                for item in items:
+                    item_name = item.get("name")
+                    if item_name:
+                        item_sources[item_name] = filepath
+                config[key].extend(items)
+
+        _index_config(config)
+
+        # Don't cache a config with broken files, so their warnings show again next run.
+        # A file rewritten in the same tick as the scan keeps its mtime and could
+        # be the same size, so skip caching until every source has settled.
+        settled = all(
+            mtime_ns is None or mtime_ns < scan_started - MTIME_TICK_NS
+            for _, mtime_ns, _ in fingerprint
+        )
+        if not load_errors and settled:
+            self._write_config_cache(fingerprint, config)
         # Note: runtime state merging should be handled in runtime.py
         return config
 
+    def _config_fingerprint(self, source_dirs):
+        """Stat the global config file and every YAML file in the source directories."""
+        fingerprint = []
+        for path in [self.resolve_path(CONFIG_FILE)] + source_dirs:
+            try:
+                st = os.stat(path)
+            except OSError:
+                fingerprint.append([path, None, None])
+                continue
+            fingerprint.append([path, st.st_mtime_ns, st.st_size])
+            if os.path.isdir(path):
+                with os.scandir(path) as it:
+                    for entry in sorted(it, key=lambda e: e.name):
+                        if entry.name.endswith((".yaml", ".yml")):
+                            st = entry.stat()
+                            fingerprint.append([entry.path, st.st_mtime_ns, st.st_size])
+        return fingerprint
+
+    def _read_config_cache(self, fingerprint):
+        """Return the cached config if it was built from the same source files, else None.
+
+        The cache holds plain JSON data only, so a cache file shipped in an untrusted
+        directory can't run code; the derived indexes are rebuilt after loading.
+        """
+        cache_file = self.resolve_path(CONFIG_CACHE_FILE)
+        try:
+            with open(cache_file, "rb") as f:
+                cached = json.loads(f.read())
+            if (
+                cached.get("version") != CONFIG_CACHE_VERSION
+                or cached.get("fingerprint") != fingerprint
+            ):
+                return None
+            config = {key: cached["config"][key] for key in _CACHED_KEYS}
+            return _index_config(config)
+        except Exception:
+            return None
+
+    def _write_config_cache(self, fingerprint, config):
+        """Write the parsed config to the cache file; failures only cost the speedup."""
+        config_home = self.find_config_home()
+        if not os.path.isdir(config_home):
+            return
+        cache_file = self.resolve_path(CONFIG_CACHE_FILE)
+        tmp_file = f"{cache_file}.tmp.{os.getpid()}"
+        try:
+            data = {key: config[key] for key in _CACHED_KEYS}
+            payload = json.dumps(
+                {"version": CONFIG_CACHE_VERSION, "fingerprint": fingerprint, "config": data},
+                separators=(",", ":"),
+            )
+            # JSON silently turns non-string keys into strings; skip caching
+            # anything that wouldn't load back exactly as it was parsed
+            if json.loads(payload)["config"] != data:
+                return
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _files_to_save(items, item_sources, new_file):
+        """Group items by the file they were loaded from; unknown or deleted sources go to new_file."""
+        files_to_save = defaultdict(list)
+        source_exists = {}
+        for item in items:
+            source_file = item_sources.get(item.get("name"))
+            if source_file:
+                exists = source_exists.get(source_file)
+                if exists is None:
+                    exists = source_exists[source_file] = os.path.exists(source_file)
+                if not exists:
+                    source_file = None
+            files_to_save[source_file or new_file].append(item)
+        return files_to_save
+
+    @staticmethod
+    def _write_yaml_if_changed(filepath, document):
+        """Dump document to filepath unless the file already holds the same data.
+
+        The comparison uses the mtime-keyed parse cache, so a save that changes
+        nothing in a file neither re-emits the YAML nor touches the disk.
+
+        Returns:
+            bool: True if the file was written
+        """
+        try:
+            if load_yaml_file(filepath) == document:
+                return False
+        except (OSError, yaml.YAMLError):
+            pass
+        write_yaml_file_atomic(filepath, document)
+        return True
+
     def save_config(self, config):
         """Save configuration back to original source files."""
-        tasks_path = self.get_config_value("paths.tasks_file", TASKS_FILE)
-        tasks_path = self.resolve_path(tasks_path)
-        task_sources = config.get("_task_sources", {})
+        paths = self._config_paths()
+        tasks_path = paths["tasks"]
         if "tasks" in config and os.path.isdir(tasks_path):
-            files_to_save = {}
-            for task in config["tasks"]:
-                task_name = task.get("name")
-                source_file = task_sources.get(task_name)
-                if source_file and os.path.exists(source_file):
-                    if source_file not in files_to_save:
-                        files_to_save[source_file] = []
-                    files_to_save[source_file].append(task)
-                else:
-                    new_file = os.path.join(tasks_path, "_new.yaml")
-                    if new_file not in files_to_save:
-                        files_to_save[new_file] = []
-                    files_to_save[new_file].append(task)
+            files_to_save = self._files_to_save(
+                config["tasks"], config.get("_task_sources", {}), os.path.join(tasks_path, "_new.yaml")
+            )
             for filepath, tasks in files_to_save.items():
-                with open(filepath, "w") as f:
-                    yaml.dump({"tasks": tasks}, f, default_flow_style=False, sort_keys=False)
+                self._write_yaml_if_changed(filepath, {"tasks": tasks})
         if "groups" in config:
-            groups_path = self.get_config_value("paths.groups_file", GROUPS_FILE)
-            groups_path = self.resolve_path(groups_path)
-            group_sources = config.get("_group_sources", {})
+            groups_path = paths["groups"]
             if os.path.isdir(groups_path):
-                files_to_save = {}
-                for group in config["groups"]:
-                    group_name = group.get("name")
-                    source_file = group_sources.get(group_name)
-                    if source_file and os.path.exists(source_file):
-                        if source_file not in files_to_save:
-                            files_to_save[source_file] = []
-                        files_to_save[source_file].append(group)
-                    else:
-                        new_file = os.path.join(groups_path, "_new.yaml")
-                        if new_file not in files_to_save:
-                            files_to_save[new_file] = []
-                        files_to_save[new_file].append(group)
+                files_to_save = self._files_to_save(
+                    config["groups"], config.get("_group_sources", {}), os.path.join(groups_path, "_new.yaml")
+                )
                 for filepath, groups in files_to_save.items():
-                    with open(filepath, "w") as f:
-                        yaml.dump({"groups": groups}, f, default_flow_style=False, sort_keys=False)
+                    self._write_yaml_if_changed(filepath, {"groups": groups})
 
     def reset(self):
         """Reset cached configuration (useful for testing or reload)."""
         self._global_config = None
         self._config_home = None
+        self._flat_config = {}
+        self._flat_source = None
+        self._resolved_paths = {}
+        self._resolved_paths_home = None
 
 
 # Global instance for backward compatibility
@@ -228,37 +403,13 @@ _default_config_manager = ConfigManager()
 
 
 # Convenience functions that use the default instance
-# These maintain backward compatibility with existing code
-def find_config_home():
-    """Find the signalbox configuration directory."""
-    return _default_config_manager.find_config_home()
-
-
-def resolve_path(path):
-    """Resolve a path relative to config home if it's not absolute."""
-    return _default_config_manager.resolve_path(path)
-
-
-def load_global_config():
-    """Load global configuration settings from config/signalbox.yaml."""
-    return _default_config_manager.load_global_config()
-
-
-def get_config_value(path, default=None):
-    """Get a configuration value using dot notation (e.g., 'execution.default_timeout')."""
-    return _default_config_manager.get_config_value(path, default)
-
-
-def load_config(suppress_warnings=False):
-    """Load configuration from tasks and groups directories."""
-    return _default_config_manager.load_config(suppress_warnings=suppress_warnings)
-
-
-def save_config(config):
-    """Save configuration back to original source files."""
-    return _default_config_manager.save_config(config)
-
-
-def reset_config():
-    """Reset the default configuration manager (useful for testing)."""
-    _default_config_manager.reset()
+# These maintain backward compatibility with existing code. They are bound
+# methods rather than def wrappers so each call skips a Python frame; reset()
+# only clears instance state, so the bindings stay valid.
+find_config_home = _default_config_manager.find_config_home
+resolve_path = _default_config_manager.resolve_path
+load_global_config = _default_config_manager.load_global_config
+get_config_value = _default_config_manager.get_config_value
+load_config = _default_config_manager.load_config
+save_config = _default_config_manager.save_config
+reset_config = _default_config_manager.reset
@@ -2,13 +2,19 @@
 #
 # SECURITY NOTE: This module executes shell commands with shell=True to support
 # pipes, redirection, and complex bash scripts. Commands are executed with the
-# full permissions of the user running signalbox.
+# full permissions of the user running signalbox. Plain commands that use no
+# shell syntax are started directly, skipping the intermediate /bin/sh.
 #
 # Configuration files MUST be trusted. See SECURITY.md for details.
 #
+import atexit
+import queue
 import subprocess
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+from collections import namedtuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 import click
 
 from .config import get_config_value
@@ -17,44 +23,140 @@ from .log_manager import ensure_log_dir, get_log_path, write_execution_log, rota
 from .exceptions import TaskNotFoundError, ExecutionError, ExecutionTimeoutError
 from . import notifications
 from . import alerts
-from .helpers import format_timestamp
+from .helpers import format_timestamp, get_timestamp_format
 
 
-def run_task(name, config):
-    """Execute a single task and log the results.
+ExecutionSettings = namedtuple(
+    "ExecutionSettings", "timeout timestamp_format alerts_enabled alerts_on_failure_only"
+)
 
-    Args:
-            name: Name of the task to run
-            config: Full configuration dict containing tasks
 
-    Returns:
-            bool: True if task executed successfully (exit code 0), False otherwise
+# Characters that need /bin/sh to interpret: quoting and escapes, expansion,
+# globbing, redirection, pipes and lists, grouping, comments and line breaks
+_SHELL_METACHARS = frozenset("|&;<>()$`\\\"'*?[]{}~#!\n\r")
 
-    Raises:
-            TaskNotFoundError: If task not found in configuration
-            ExecutionTimeoutError: If task execution times out
-            ExecutionError: If task execution fails for any other reason
+# Builtins and reserved words with no equivalent executable on PATH; echo, pwd
+# and kill have executables, but the builtins behave differently
+_SHELL_WORDS = frozenset(
+    {
+        ".", ":", "[[", "alias", "bg", "break", "builtin", "case", "cd", "command", "continue",
+        "coproc", "declare", "dirs", "disown", "do", "done", "echo", "elif", "else", "esac",
+        "eval", "exec", "exit", "export", "fc", "fg", "fi", "for", "function", "getopts", "hash",
+        "history", "if", "jobs", "kill", "let", "local", "logout", "mapfile", "popd", "pushd",
+        "pwd", "read", "readonly", "return", "select", "set", "shift", "shopt", "source",
+        "suspend", "then", "time", "times", "trap", "type", "typeset", "ulimit", "umask",
+        "unalias", "unset", "until", "wait", "while",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _direct_argv(command):
+    """Split a command that uses no shell syntax into an argv tuple.
+
+    Returns:
+            tuple: Arguments to exec directly, or None if the command needs a shell
     """
+    if not isinstance(command, str) or not _SHELL_METACHARS.isdisjoint(command):
+        return None
+    argv = tuple(word for word in command.replace("\t", " ").split(" ") if word)
+    # A leading NAME=value is a variable assignment, not a program
+    if not argv or "=" in argv[0] or argv[0] in _SHELL_WORDS:
+        return None
+    return argv
+
+
+def _run_command(command, stdout, stderr, timeout):
+    """Run a task command, bypassing the shell when it needs no shell features."""
+    argv = _direct_argv(command)
+    if argv is not None:
+        try:
+            return subprocess.run(argv, stdout=stdout, stderr=stderr, timeout=timeout)
+        except OSError:
+            # Not runnable directly (missing, not executable, or no shebang so
+            # exec fails with ENOEXEC); let the shell run it as before
+            pass
+    return subprocess.run(command, shell=True, stdout=stdout, stderr=stderr, timeout=timeout)
+
+
+# Log rotation runs on one background thread so the directory scan and
+# deletions don't hold up the next task; queued rotations are drained at exit
+_rotation_queue = queue.Queue()
+_rotation_pending = set()
+_rotation_lock = threading.Lock()
+_rotation_thread = None
+
+
+def _rotation_worker():
+    """Rotate logs for queued tasks, one at a time, for the life of the process."""
+    while True:
+        task = _rotation_queue.get()
+        try:
+            with _rotation_lock:
+                _rotation_pending.discard(task["name"])
+            rotate_logs(task)
+        finally:
+            _rotation_queue.task_done()
 
-    # Validate configuration before running task
-    from . import validator, config as config_mod
 
-    validation_result = validator.validate_configuration()
-    if validation_result.errors or validation_result.warnings:
-        click.echo("Some configuration errors or warnings were found. Please run 'signalbox validate' for details.")
+def _schedule_rotation(task):
+    """Queue log rotation for a task, skipping it if one is already pending."""
+    global _rotation_thread
+    with _rotation_lock:
+        if task["name"] in _rotation_pending:
+            return
+        _rotation_pending.add(task["name"])
+        if _rotation_thread is None:
+            _rotation_thread = threading.Thread(target=_rotation_worker, name="signalbox-rotate", daemon=True)
+            _rotation_thread.start()
+            atexit.register(wait_for_rotations)
+    _rotation_queue.put(task)
 
-    # Reload config with warnings suppressed for task execution
-    config = config_mod.load_config(suppress_warnings=True)
 
-    task = next((s for s in config["tasks"] if s["name"] == name), None)
-    if not task:
-        raise TaskNotFoundError(name)
+def wait_for_rotations():
+    """Block until every queued log rotation has finished."""
+    _rotation_queue.join()
 
-    # Prepare logging
-    ensure_log_dir(name)
-    timestamp = format_timestamp(datetime.now())
-    log_file = get_log_path(name, timestamp)
 
+def _exc_text(e):
+    """Return an exception's message attribute if it has one, else its str()."""
+    return getattr(e, "message", None) or str(e)
+
+
+def _read_output(output_file):
+    """Read captured command output back from a temporary file as text."""
+    output_file.seek(0)
+    return output_file.read().decode("utf-8", errors="replace")
+
+
+# Per-thread list of pending output lines; None means echo straight away
+_echo_buffer = threading.local()
+
+
+def _echo(message=""):
+    """Echo a line, or hold it back if this thread is buffering its output."""
+    lines = getattr(_echo_buffer, "lines", None)
+    if lines is None:
+        click.echo(message)
+    else:
+        lines.append(message)
+
+
+def _flush_echo():
+    """Print this thread's buffered lines in a single echo and stop buffering."""
+    lines = getattr(_echo_buffer, "lines", None)
+    _echo_buffer.lines = None
+    if lines:
+        click.echo("\n".join(lines))
+
+
+def snapshot_execution_settings():
+    """Read the execution settings that stay fixed for the length of a run.
+
+    Returns:
+            ExecutionSettings: Effective timeout (None for no timeout), log timestamp
+            format and alert notification defaults
+    """
     # Get timeout setting
     timeout = get_config_value("execution.default_timeout", 300)
     # Security: Enforce minimum timeout of 1 second to prevent DOS attacks
@@ -66,29 +168,102 @@ def run_task(name, config):
         click.echo(f"Warning: Timeout {timeout}s is below minimum {min_timeout}s, using minimum", err=True)
         timeout = min_timeout
 
-    try:
-        click.echo("")  # Add a blank line before each task execution output
-        # Execute the task
-        result = subprocess.run(task["command"], shell=True, capture_output=True, text=True, timeout=timeout)
+    return ExecutionSettings(
+        timeout=timeout,
+        timestamp_format=get_timestamp_format(),
+        alerts_enabled=get_config_value("alerts.notifications.enabled", True),
+        alerts_on_failure_only=get_config_value("alerts.notifications.on_failure_only", True),
+    )
+
+
+def validate_and_reload_config():
+    """Validate the configuration and reload it for task execution.
+
+    Returns:
+            dict: Freshly loaded configuration, with load warnings suppressed
+    """
+    from . import validator, config as config_mod
+
+    validation_result = validator.validate_configuration()
+    if validation_result.errors or validation_result.warnings:
+        click.echo("Some configuration errors or warnings were found. Please run 'signalbox validate' for details.")
 
-        # Write log file
-        write_execution_log(log_file, task["command"], result.returncode, result.stdout, result.stderr)
+    # Reload config with warnings suppressed for task execution
+    return config_mod.load_config(suppress_warnings=True)
+
+
+def run_task(name, config, settings=None, skip_validation=False):
+    """Execute a single task and log the results.
+
+    Args:
+            name: Name of the task to run
+            config: Full configuration dict containing tasks
+            settings: Optional ExecutionSettings snapshot; groups pass one so
+                      the settings are read once per run instead of per task
+            skip_validation: If True, use config as given; callers running many
+                      tasks validate and reload once up front instead of per task
+
+    Returns:
+            bool: True if task executed successfully (exit code 0), False otherwise
+
+    Raises:
+            TaskNotFoundError: If task not found in configuration
+            ExecutionTimeoutError: If task execution times out
+            ExecutionError: If task execution fails for any other reason
+    """
+    if not skip_validation:
+        config = validate_and_reload_config()
+
+    tasks_by_name = config.get("_tasks_by_name")
+    if tasks_by_name is not None:
+        task = tasks_by_name.get(name)
+    else:
+        task = next((s for s in config["tasks"] if s["name"] == name), None)
+    if not task:
+        raise TaskNotFoundError(name)
+
+    if settings is None:
+        settings = snapshot_execution_settings()
+    timeout = settings.timeout
 
-        # Check for alert patterns in output
-        combined_output = result.stdout + "\n" + result.stderr
-        triggered_alerts = alerts.check_alert_patterns(name, task, combined_output)
+    # Prepare logging
+    ensure_log_dir(name)
+    timestamp = format_timestamp(timestamp_format=settings.timestamp_format)
+    log_file = get_log_path(name, timestamp)
+
+    try:
+        _echo("")  # Add a blank line before each task execution output
+        # Execute the task
+        # The child writes straight into temporary files, so large outputs are
+        # never drained through a pipe or held in memory before hitting the log
+        with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+            result = _run_command(task["command"], stdout_file, stderr_file, timeout)
+
+            # Write log file
+            write_execution_log(log_file, task["command"], result.returncode, stdout_file, stderr_file)
+
+            # The log already holds the raw bytes; only tasks with alert
+            # patterns need the output decoded back into text and checked
+            triggered_alerts = []
+            if task.get("alerts"):
+                # Check for alert patterns in output; the streams are searched
+                # one at a time rather than joined into a combined copy
+                outputs = [_read_output(stdout_file), _read_output(stderr_file)]
+                triggered_alerts = alerts.check_alert_patterns(
+                    name, task, outputs, config.get("_alert_patterns", {}).get(name)
+                )
 
         # Save and optionally notify for each triggered alert
         if triggered_alerts:
-            global_alerts_enabled = get_config_value("alerts.notifications.enabled", True)
-            global_on_failure_only = get_config_value("alerts.notifications.on_failure_only", True)
-            
+            global_alerts_enabled = settings.alerts_enabled
+            global_on_failure_only = settings.alerts_on_failure_only
+
             for alert in triggered_alerts:
                 alerts.save_alert(name, alert)
 
                 # Always log to console
                 severity_label = alert["severity"].upper()
-                click.echo(f"  [{severity_label}] {alert['message']}")
+                _echo(f"  [{severity_label}] {alert['message']}")
 
                 # Check if notifications are enabled (global or per-alert override)
                 alert_notify = alert.get("notify")
@@ -114,12 +289,12 @@ def run_task(name, config):
                         urgency="critical" if alert_severity == "critical" else "normal",
                     )
 
-        # Rotate old logs
-        rotate_logs(task)
+        # Rotate old logs in the background
+        _schedule_rotation(task)
 
         # Determine status and save runtime state
         status = "success" if result.returncode == 0 else "failed"
-        click.echo(f"Task {name} {status}. Log: {log_file}")
+        _echo(f"Task {name} {status}. Log: {log_file}")
 
         task_source_file = config["_task_sources"].get(name)
         if task_source_file:
@@ -137,52 +312,92 @@ def run_task(name, config):
         raise ExecutionError(name, str(e))
 
 
-def run_group_parallel(task_names, config):
+# Worker pool shared by parallel group runs, created on first use
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers):
+    """Return the shared worker pool, growing it if more workers are needed."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < max_workers:
+            if _pool is not None:
+                # Work already submitted to the old pool still finishes
+                _pool.shutdown(wait=False)
+            _pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="signalbox")
+            _pool_workers = max_workers
+        return _pool
+
+
+def shutdown_pool():
+    """Shut down the shared worker pool; the next parallel run creates a new one."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def run_group_parallel(task_names, config, results=None):
     """Execute multiple tasks in parallel.
 
     Args:
             task_names: List of task names to execute
-            config: Full configuration dict
+            config: Full configuration dict, used as given; the caller validates
+                    and loads it once (see validate_and_reload_config)
+            results: Optional list that receives a (task_name, success, error) tuple
+                     per task, in task order
 
     Returns:
             int: Number of tasks that executed successfully
     """
-    max_workers = get_config_value("execution.max_parallel_workers", 5)
+    settings = snapshot_execution_settings()
+    # No point starting more threads than there are tasks
+    max_workers = max(1, min(get_config_value("execution.max_parallel_workers", 5), len(task_names)))
 
     def run_task_wrapper(task_name):
         """Wrapper for parallel execution that catches exceptions."""
+        # Collect this task's lines and print them as one block when it ends,
+        # so concurrent tasks don't interleave and each line isn't a separate flush
+        _echo_buffer.lines = []
         try:
-            click.echo("")  # Add a blank line before each group task execution output
-            click.echo(f"Running {task_name}...")
-            success = run_task(task_name, config)
+            _echo("")  # Add a blank line before each group task execution output
+            _echo(f"Running {task_name}...")
+            success = run_task(task_name, config, settings, skip_validation=True)
             return (task_name, success, None)
         except Exception as e:
-            click.echo(f"Error: {e.message if hasattr(e, 'message') else str(e)}")
+            _echo(f"Error: {_exc_text(e)}")
             return (task_name, False, str(e))
-
-    # Execute tasks in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(run_task_wrapper, name): name for name in task_names}
-        results = []
-        for future in as_completed(futures):
-            task_name, success, error = future.result()
-            results.append((task_name, success, error))
+        finally:
+            _flush_echo()
+
+    # Execute tasks in parallel on the shared pool, then collect every result
+    # after a single wait instead of waking up once per completed task
+    pool = _get_pool(max_workers)
+    futures = [pool.submit(run_task_wrapper, name) for name in task_names]
+    wait(futures)
+    completed = [future.result() for future in futures]
+    if results is not None:
+        results.extend(completed)
 
     # Print summary
     click.echo("\nParallel execution summary:")
-    success_count = sum(1 for _, success, _ in results if success)
-    click.echo(f"  Completed: {len(results)}/{len(task_names)}")
-    click.echo(f"  Successful: {success_count}/{len(results)}")
+    success_count = sum(1 for _, success, _ in completed if success)
+    click.echo(f"  Completed: {len(completed)}/{len(task_names)}")
+    click.echo(f"  Successful: {success_count}/{len(completed)}")
 
     failed_names = None
-    if success_count < len(results):
-        failed_names = [name for name, success, _ in results if not success]
+    if success_count < len(completed):
+        failed_names = [name for name, success, _ in completed if not success]
         click.echo(f"  Failed: {', '.join(failed_names)}")
 
     # Send notification
-    failed_count = len(results) - success_count
+    failed_count = len(completed) - success_count
     notifications.notify_execution_result(
-        total=len(results),
+        total=len(completed),
         passed=success_count,
         failed=failed_count,
         context="tasks",
@@ -193,39 +408,66 @@ def run_group_parallel(task_names, config):
     return success_count
 
 
-def run_group_serial(task_names, config, stop_on_error):
+def _run_serial_task(task_name, config, settings):
+    """Run one task of a serial group, turning exceptions into a failed outcome.
+
+    Returns:
+            tuple: (task_name, success, error)
+    """
+    try:
+        click.echo("")  # Add a blank line before each group task execution output
+        click.echo(f"Running {task_name}...")
+        success = run_task(task_name, config, settings, skip_validation=True)
+        return (task_name, success, None)
+    except Exception as e:
+        click.echo(f"Error: {_exc_text(e)}")
+        return (task_name, False, str(e))
+
+
+def _run_serial_until_failure(task_names, run_one):
+    """Run tasks in order, stopping after the first one that fails."""
+    completed = []
+    for task_name in task_names:
+        outcome = run_one(task_name)
+        completed.append(outcome)
+        if not outcome[1]:
+            if outcome[2] is None:
+                click.echo(f"⚠️  Task {task_name} failed. Stopping group execution (stop_on_error=true)")
+            else:
+                click.echo(f"⚠️  Stopping group execution (stop_on_error=true)")
+            break
+    return completed
+
+
+def run_group_serial(task_names, config, stop_on_error, results=None):
     """Execute multiple tasks sequentially.
 
     Args:
             task_names: List of task names to execute
-            config: Full configuration dict
+            config: Full configuration dict, used as given; the caller validates
+                    and loads it once (see validate_and_reload_config)
             stop_on_error: If True, stop execution when a task fails
+            results: Optional list that receives a (task_name, success, error) tuple
+                     per task that ran, in task order
 
     Returns:
             int: Number of tasks that executed successfully
     """
-    success_count = 0
-    failed_names = []
+    settings = snapshot_execution_settings()
 
-    for task_name in task_names:
-        try:
-            click.echo("")  # Add a blank line before each group task execution output
-            click.echo(f"Running {task_name}...")
-            success = run_task(task_name, config)
+    def run_one(task_name):
+        return _run_serial_task(task_name, config, settings)
 
-            if success:
-                success_count += 1
-            else:
-                failed_names.append(task_name)
-                if stop_on_error:
-                    click.echo(f"⚠️  Task {task_name} failed. Stopping group execution (stop_on_error=true)")
-                    break
-        except Exception as e:
-            click.echo(f"Error: {e.message if hasattr(e, 'message') else str(e)}")
-            failed_names.append(task_name)
-            if stop_on_error:
-                click.echo(f"⚠️  Stopping group execution (stop_on_error=true)")
-                break
+    # stop_on_error is fixed for the whole run, so pick the loop once up front
+    if stop_on_error:
+        completed = _run_serial_until_failure(task_names, run_one)
+    else:
+        completed = [run_one(task_name) for task_name in task_names]
+    if results is not None:
+        results.extend(completed)
+
+    success_count = sum(1 for _, success, _ in completed if success)
+    failed_names = [name for name, success, _ in completed if not success]
 
     # Send notification
     failed_count = len(failed_names)
@@ -1,8 +1,18 @@
 # Export functionality for systemd and cron
 
 import os
+import shutil
+import sys
+from functools import lru_cache
+
 from .config import get_config_value
 
+# Project root (parent of the core directory), used when running from a checkout.
+# __file__ is already absolute on normal imports, so join/normpath is enough and
+# avoids the getcwd() that abspath would do.
+_CORE_DIR = os.path.dirname(__file__) or os.getcwd()
+_PROJECT_ROOT = os.path.normpath(os.path.join(_CORE_DIR, os.pardir))
+
 
 class ExportResult:
     """Container for export operation results."""
@@ -53,72 +63,73 @@ def get_python_executable():
     Returns:
             str: Path to Python executable
     """
-    import sys
-
     return sys.executable
 
 
-def get_signalbox_command():
+@lru_cache(maxsize=None)
+def _dev_signalbox_command():
+    """Return the command for the checkout's signalbox.py, or None if it is missing."""
+    signalbox_py = os.path.join(_PROJECT_ROOT, "signalbox.py")
+    if os.path.exists(signalbox_py):
+        return f"{get_python_executable()} {signalbox_py}"
+    return None
+
+
+def get_signalbox_command(installed=None):
     """Determine the signalbox command to use for exported tasks.
 
+    Args:
+            installed: Whether signalbox is on PATH; looked up when None
+
     Returns:
             str: Command to invoke signalbox (either CLI entry point or task path)
     """
-    import shutil
-
     # Check if signalbox is installed as a CLI command
-    signalbox_cmd = shutil.which("signalbox")
-    if signalbox_cmd:
+    if installed is None:
+        installed = shutil.which("signalbox") is not None
+    if installed:
         return "signalbox"
 
-    # Fall back to development mode - use the root signalbox.py
-    # Find the project root (parent of core directory)
-    core_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(core_dir)
-    signalbox_py = os.path.join(project_root, "signalbox.py")
-
-    if os.path.exists(signalbox_py):
-        python_exec = get_python_executable()
-        return f"{python_exec} {signalbox_py}"
-
-    # Last resort fallback
-    return "signalbox"
+    # Fall back to development mode - use the root signalbox.py,
+    # or the bare command as a last resort
+    return _dev_signalbox_command() or "signalbox"
 
 
-def get_task_dir():
+def get_task_dir(installed=None):
     """Get the absolute path to the task directory.
 
     Returns the directory where tasks should be executed from.
     In production, this is typically the user's home or config directory.
     In development, this is the project root.
-    """
-    import shutil
 
+    Args:
+            installed: Whether signalbox is on PATH; looked up when None
+    """
     # If signalbox is installed, use the config directory
-    if shutil.which("signalbox"):
+    if installed is None:
+        installed = shutil.which("signalbox") is not None
+    if installed:
         return os.path.expanduser("~/.config/signalbox")
 
     # In development mode, use project root
-    core_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(core_dir)
-    return project_root
+    return _PROJECT_ROOT
 
 
-def generate_systemd_service(group, group_name):
-    """Generate systemd service file content.
+def get_export_paths():
+    """Resolve the working directory and signalbox command for exported files.
 
-    Args:
-            group: Group configuration dict
-            group_name: Name of the group
+    Both depend on whether signalbox is on PATH, so the PATH search is done
+    once and shared; exports of several files can reuse the result.
 
     Returns:
-            str: Service file content
+            dict: task_dir and signalbox_cmd
     """
-    task_dir = get_task_dir()
-    signalbox_cmd = get_signalbox_command()
+    installed = shutil.which("signalbox") is not None
+    return {"task_dir": get_task_dir(installed), "signalbox_cmd": get_signalbox_command(installed)}
+
 
-    return f"""[Unit]
-Description=signalbox - {group.get('description', group_name)}
+_SYSTEMD_SERVICE_TEMPLATE = """[Unit]
+Description=signalbox - {description}
 After=network.target
 
 [Service]
@@ -132,22 +143,8 @@ StandardError=journal
 WantedBy=multi-user.target
 """
 
-
-def generate_systemd_timer(group, group_name):
-    """Generate systemd timer file content.
-
-    Args:
-            group: Group configuration dict
-            group_name: Name of the group
-
-    Returns:
-            str: Timer file content
-    """
-    service_name = f"signalbox-{group_name}"
-    cron_schedule = get_schedule_string(group)
-
-    return f"""[Unit]
-Description=Timer for signalbox - {group.get('description', group_name)}
+_SYSTEMD_TIMER_TEMPLATE = """[Unit]
+Description=Timer for signalbox - {description}
 Requires={service_name}.service
 
 [Timer]
@@ -164,42 +161,123 @@ OnCalendar=*-*-* *:00:00
 WantedBy=timers.target
 """
 
+_CRON_ENTRY_TEMPLATE = "{schedule} cd {task_dir} && {signalbox_cmd} group run {group_name}"
 
-def export_systemd(group, group_name):
-    """Export systemd service and timer files for a group.
+
+def generate_systemd_service(group, group_name, export_paths=None):
+    """Generate systemd service file content.
 
     Args:
             group: Group configuration dict
             group_name: Name of the group
+            export_paths: Optional result of get_export_paths() to reuse
 
     Returns:
-            ExportResult: Result of the export operation
+            str: Service file content
     """
-    # Validate group
-    is_valid, error = validate_group_for_export(group, group_name)
-    if not is_valid:
-        return ExportResult(success=False, error=error)
+    if export_paths is None:
+        export_paths = get_export_paths()
+
+    return _SYSTEMD_SERVICE_TEMPLATE.format_map(
+        {
+            "description": group.get("description", group_name),
+            "task_dir": export_paths["task_dir"],
+            "signalbox_cmd": export_paths["signalbox_cmd"],
+            "group_name": group_name,
+        }
+    )
+
 
-    # Create export directory
+def generate_systemd_timer(group, group_name):
+    """Generate systemd timer file content.
+
+    Args:
+            group: Group configuration dict
+            group_name: Name of the group
+
+    Returns:
+            str: Timer file content
+    """
+    return _SYSTEMD_TIMER_TEMPLATE.format_map(
+        {
+            "description": group.get("description", group_name),
+            "service_name": f"signalbox-{group_name}",
+            "cron_schedule": get_schedule_string(group),
+        }
+    )
+
+
+def _write_export_files(files):
+    """Write generated export files, creating each distinct directory once.
+
+    Args:
+            files: Dict mapping file path to its content
+    """
+    for export_dir in {os.path.dirname(path) for path in files}:
+        os.makedirs(export_dir, exist_ok=True)
+    for path, content in files.items():
+        # Each file is small and complete, so skip the text/buffered file layers
+        # and hand the encoded bytes straight to write(); 0o666 is what open() uses
+        data = content.encode()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+
+def export_all_systemd(groups):
+    """Export systemd service and timer files for several groups at once.
+
+    The signalbox command and working directory are resolved once for the
+    whole batch, and every file is written in a single pass.
+
+    Args:
+            groups: Iterable of (group, group_name) pairs
+
+    Returns:
+            list: One ExportResult per group, in the order given
+    """
+    results = []
+    files = {}
+    export_paths = None
     export_base_dir = get_config_value("paths.systemd_export_dir", "systemd")
-    export_dir = os.path.join(export_base_dir, group_name)
-    os.makedirs(export_dir, exist_ok=True)
 
-    service_name = f"signalbox-{group_name}"
-    service_file = os.path.join(export_dir, f"{service_name}.service")
-    timer_file = os.path.join(export_dir, f"{service_name}.timer")
+    for group, group_name in groups:
+        # Validate group
+        is_valid, error = validate_group_for_export(group, group_name)
+        if not is_valid:
+            results.append(ExportResult(success=False, error=error))
+            continue
+
+        if export_paths is None:
+            export_paths = get_export_paths()
+
+        export_dir = os.path.join(export_base_dir, group_name)
+        service_name = f"signalbox-{group_name}"
+        service_file = os.path.join(export_dir, f"{service_name}.service")
+        timer_file = os.path.join(export_dir, f"{service_name}.timer")
+
+        files[service_file] = generate_systemd_service(group, group_name, export_paths)
+        files[timer_file] = generate_systemd_timer(group, group_name)
+        results.append(ExportResult(success=True, files=[service_file, timer_file]))
 
-    # Generate and write service file
-    service_content = generate_systemd_service(group, group_name)
-    with open(service_file, "w") as f:
-        f.write(service_content)
+    _write_export_files(files)
+    return results
 
-    # Generate and write timer file
-    timer_content = generate_systemd_timer(group, group_name)
-    with open(timer_file, "w") as f:
-        f.write(timer_content)
 
-    return ExportResult(success=True, files=[service_file, timer_file])
+def export_systemd(group, group_name):
+    """Export systemd service and timer files for a group.
+
+    Args:
+            group: Group configuration dict
+            group_name: Name of the group
+
+    Returns:
+            ExportResult: Result of the export operation
+    """
+    return export_all_systemd([(group, group_name)])[0]
 
 
 def get_systemd_install_instructions(service_file, timer_file, group_name, user=False):
@@ -243,54 +321,78 @@ def get_systemd_install_instructions(service_file, timer_file, group_name, user=
     return instructions
 
 
-def generate_cron_entry(group, group_name):
+def generate_cron_entry(group, group_name, export_paths=None):
     """Generate cron entry for a group.
 
     Args:
             group: Group configuration dict
             group_name: Name of the group
+            export_paths: Optional result of get_export_paths() to reuse
 
     Returns:
             str: Cron entry line
     """
-    task_dir = get_task_dir()
-    signalbox_cmd = get_signalbox_command()
+    if export_paths is None:
+        export_paths = get_export_paths()
 
-    return f"{get_schedule_string(group)} cd {task_dir} && {signalbox_cmd} group run {group_name}"
+    return _CRON_ENTRY_TEMPLATE.format_map(
+        {
+            "schedule": get_schedule_string(group),
+            "task_dir": export_paths["task_dir"],
+            "signalbox_cmd": export_paths["signalbox_cmd"],
+            "group_name": group_name,
+        }
+    )
 
 
-def export_cron(group, group_name):
-    """Export crontab entry for a group.
+def export_all_cron(groups):
+    """Export crontab entries for several groups at once.
 
     Args:
-            group: Group configuration dict
-            group_name: Name of the group
+            groups: Iterable of (group, group_name) pairs
 
     Returns:
-            ExportResult: Result of the export operation with cron_entry attribute
+            list: One ExportResult per group, in the order given; successful
+                  results carry a cron_entry attribute
     """
-    # Validate group
-    is_valid, error = validate_group_for_export(group, group_name)
-    if not is_valid:
-        return ExportResult(success=False, error=error)
-
-    # Create export directory
+    results = []
+    files = {}
+    export_paths = None
     export_base_dir = get_config_value("paths.cron_export_dir", "cron")
-    export_dir = os.path.join(export_base_dir, group_name)
-    os.makedirs(export_dir, exist_ok=True)
 
-    cron_file = os.path.join(export_dir, f"{group_name}.cron")
-    cron_entry = generate_cron_entry(group, group_name)
+    for group, group_name in groups:
+        # Validate group
+        is_valid, error = validate_group_for_export(group, group_name)
+        if not is_valid:
+            results.append(ExportResult(success=False, error=error))
+            continue
+
+        if export_paths is None:
+            export_paths = get_export_paths()
+
+        cron_file = os.path.join(export_base_dir, group_name, f"{group_name}.cron")
+        cron_entry = generate_cron_entry(group, group_name, export_paths)
+        files[cron_file] = f"# {group.get('description', group_name)}\n{cron_entry}\n"
 
-    # Write to file
-    with open(cron_file, "w") as f:
-        f.write(f"# {group.get('description', group_name)}\n")
-        f.write(f"{cron_entry}\n")
+        result = ExportResult(success=True, files=[cron_file])
+        result.cron_entry = cron_entry
+        results.append(result)
 
-    result = ExportResult(success=True, files=[cron_file])
-    result.cron_entry = cron_entry
+    _write_export_files(files)
+    return results
 
-    return result
+
+def export_cron(group, group_name):
+    """Export crontab entry for a group.
+
+    Args:
+            group: Group configuration dict
+            group_name: Name of the group
+
+    Returns:
+            ExportResult: Result of the export operation with cron_entry attribute
+    """
+    return export_all_cron([(group, group_name)])[0]
 
 
 def get_cron_install_instructions(cron_file, cron_entry, group):
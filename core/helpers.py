@@ -3,9 +3,171 @@ Helper utilities for signalbox to reduce code duplication.
 """
 
 import os
+import pickle
+import shutil
+import threading
+import time
 import yaml
 import click
-from typing import Dict, List, Optional, Callable
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Callable, Tuple
+
+# Prefer libyaml's C parser/emitter when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Coarsest file timestamp granularity to allow for (FAT rounds to 2s). A file
+# rewritten within the same tick keeps its mtime, so caches keyed by mtime
+# don't keep results for files modified this recently.
+MTIME_TICK_NS = 2_000_000_000
+
+# Parsed YAML per file path, validated by (st_mtime_ns, st_size). Values are
+# stored pickled so every hit hands back a private copy callers may mutate.
+# A file only gets a snapshot once it has been parsed twice, so one-shot CLI
+# runs that read each file once don't pay for pickling it.
+_YAML_CACHE_SIZE = 100
+_yaml_cache = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
+def load_yaml_file(filepath: str):
+    """
+    Parse a YAML file, reusing the previous parse while its mtime and size are unchanged.
+
+    Raises the same errors as opening and parsing the file directly.
+    """
+    read_started = time.time_ns()
+    st = os.stat(filepath)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _yaml_cache_lock:
+        hit = _yaml_cache.get(filepath)
+        if hit is not None and hit[0] == stamp and hit[1] is not None:
+            _yaml_cache.move_to_end(filepath)
+            return pickle.loads(hit[1])
+    # An entry without a snapshot means this unchanged file was parsed before
+    read_before = hit is not None and hit[0] == stamp
+
+    # Hand libyaml the raw bytes (it detects UTF-8/16 itself): one unbuffered
+    # readall instead of a text wrapper decoding the file first
+    with open(filepath, "rb", buffering=0) as f:
+        data = yaml.load(f.read(), Loader=YAML_LOADER)
+
+    # A file rewritten in the same tick could keep its mtime and size, so a
+    # snapshot is only taken once the file has settled
+    settled = st.st_mtime_ns < read_started - MTIME_TICK_NS
+    snapshot = pickle.dumps(data, pickle.HIGHEST_PROTOCOL) if read_before and settled else None
+    with _yaml_cache_lock:
+        _yaml_cache[filepath] = (stamp, snapshot)
+        _yaml_cache.move_to_end(filepath)
+        while len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return data
+
+
+def write_yaml_file_atomic(filepath: str, data, header: str = "") -> None:
+    """
+    Dump data as YAML to a temporary file beside filepath, then rename it into place.
+
+    Readers never see a half-written file, and concurrent writers from
+    parallel task runs each replace the file whole instead of interleaving.
+
+    Args:
+        filepath: Destination YAML file
+        data: Data to dump
+        header: Optional text (e.g. a comment line) written before the YAML
+    """
+    # Replace the file a symlink points at, not the link itself, and keep the
+    # existing file's permissions on the new copy
+    target = os.path.realpath(filepath)
+    tmp_path = f"{target}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, "w", buffering=65536) as f:
+            if header:
+                f.write(header)
+            yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _sorted_yaml_entries(
+    directory: str,
+    filename_suffix: tuple,
+    filename_prefix: str = "",
+    filter_func: Optional[Callable[[str], bool]] = None,
+) -> list:
+    """Return the regular files in directory that pass every filename filter, sorted by name.
+
+    Hidden files are skipped. The cheap name checks run first, in one
+    expression, so filter_func and the file type check only see candidates.
+    """
+    # scandir yields names and file types together, so no extra stat per entry
+    with os.scandir(directory) as it:
+        return sorted(
+            (
+                e
+                for e in it
+                if e.name.endswith(filename_suffix)
+                and e.name.startswith(filename_prefix)
+                and not e.name.startswith(".")
+                and (filter_func is None or filter_func(e.name))
+                and e.is_file()
+            ),
+            key=lambda e: e.name,
+        )
+
+
+def iter_yaml_files_from_dir(
+    directory: str,
+    key: str,
+    filter_func: Optional[Callable[[str], bool]] = None,
+    filename_prefix: str = "",
+    filename_suffix: tuple = (".yaml", ".yml"),
+    suppress_warnings: bool = False,
+    errors: Optional[list] = None,
+) -> Iterator[Tuple[str, list]]:
+    """
+    Yield (filepath, items) for each matching YAML file in a directory.
+
+    items is the list parsed from the file's key (a single value is wrapped in a
+    list), handed over as-is so callers can merge it without copying or wrapping
+    every entry. Files are visited in name order and filtered the same way as
+    load_yaml_files_from_dir.
+    """
+    # Skip files in build/ directory (a "build" component anywhere in the path)
+    if f"{os.sep}build{os.sep}" in f"{os.sep}{directory}{os.sep}":
+        return
+
+    # Opening the directory doubles as the existence check
+    try:
+        entries = _sorted_yaml_entries(directory, filename_suffix, filename_prefix, filter_func)
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        filepath = entry.path
+
+        try:
+            data = load_yaml_file(filepath)
+            if not (data and key in data):
+                continue
+            items_from_file = data[key] if isinstance(data[key], list) else [data[key]]
+        except Exception as e:
+            if errors is not None:
+                errors.append(filepath)
+            # Allow global suppression via env var; only consulted when there is
+            # something to warn about, and read then since the CLI sets it at runtime
+            if not (suppress_warnings or os.environ.get("SIGNALBOX_SUPPRESS_CONFIG_WARNINGS", "0") == "1"):
+                click.echo(f"Warning: Failed to load {filepath}: {e}", err=True)
+            continue
+        yield filepath, items_from_file
 
 
 def load_yaml_files_from_dir(
@@ -16,12 +178,8 @@ def load_yaml_files_from_dir(
     filename_suffix: tuple = (".yaml", ".yml"),
     track_sources: bool = False,
     suppress_warnings: bool = False,
+    errors: Optional[list] = None,
 ) -> list:
-    import os
-
-    # Allow global suppression via env var
-    if os.environ.get("SIGNALBOX_SUPPRESS_CONFIG_WARNINGS", "0") == "1":
-        suppress_warnings = True
     """
     Load and merge YAML files from a directory.
     
@@ -35,6 +193,9 @@ def load_yaml_files_from_dir(
         filename_prefix: Only process files starting with this prefix
         filename_suffix: Tuple of file extensions to process (default: .yaml, .yml)
         track_sources: If True, return dicts with 'data' and 'source' keys
+        suppress_warnings: If True, don't warn about files that fail to load
+            (also enabled by SIGNALBOX_SUPPRESS_CONFIG_WARNINGS=1)
+        errors: Optional list that receives the path of every file that failed to load
         
     Returns:
         List of items extracted from all matching YAML files.
@@ -58,40 +219,19 @@ def load_yaml_files_from_dir(
         # Returns: [{"data": {...}, "source": "path/to/file.yaml"}, ...]
     """
     items = []
-
-    if not os.path.exists(directory):
-        return items
-
-
-    for filename in sorted(os.listdir(directory)):
-        filepath = os.path.join(directory, filename)
-        # Skip files in build/ directory
-        if 'build' in filepath.split(os.sep):
-            continue
-
-        # Apply filters
-        if filename_prefix and not filename.startswith(filename_prefix):
-            continue
-
-        if not filename.endswith(filename_suffix):
-            continue
-
-        if filter_func and not filter_func(filename):
-            continue
-
-        try:
-            with open(filepath, "r") as f:
-                data = yaml.safe_load(f)
-                if data and key in data:
-                    items_from_file = data[key] if isinstance(data[key], list) else [data[key]]
-                    if track_sources:
-                        for item in items_from_file:
-                            items.append({"data": item, "source": filepath})
-                    else:
-                        items.extend(items_from_file)
-        except Exception as e:
-            if not suppress_warnings:
-                click.echo(f"Warning: Failed to load {filepath}: {e}", err=True)
+    for filepath, items_from_file in iter_yaml_files_from_dir(
+        directory,
+        key,
+        filter_func=filter_func,
+        filename_prefix=filename_prefix,
+        filename_suffix=filename_suffix,
+        suppress_warnings=suppress_warnings,
+        errors=errors,
+    ):
+        if track_sources:
+            items.extend({"data": item, "source": filepath} for item in items_from_file)
+        else:
+            items.extend(items_from_file)
 
     return items
 
@@ -101,7 +241,7 @@ def load_yaml_dict_from_dir(
     key: str,
     filter_func: Optional[Callable[[str], bool]] = None,
     filename_prefix: str = "",
-    filename_suffix: str = (".yaml", ".yml"),
+    filename_suffix: tuple = (".yaml", ".yml"),
 ) -> Dict:
     """
     Load and merge YAML files from a directory into a dictionary.
@@ -129,28 +269,19 @@ def load_yaml_dict_from_dir(
     """
     merged_dict = {}
 
-    if not os.path.exists(directory):
+    try:
+        entries = _sorted_yaml_entries(directory, filename_suffix, filename_prefix, filter_func)
+    except FileNotFoundError:
         return merged_dict
 
-    for filename in sorted(os.listdir(directory)):
-        # Apply filters
-        if filename_prefix and not filename.startswith(filename_prefix):
-            continue
-
-        if not filename.endswith(filename_suffix):
-            continue
-
-        if filter_func and not filter_func(filename):
-            continue
-
-        filepath = os.path.join(directory, filename)
+    for entry in entries:
+        filepath = entry.path
 
         try:
-            with open(filepath, "r") as f:
-                data = yaml.safe_load(f)
-                if data and key in data:
-                    if isinstance(data[key], dict):
-                        merged_dict.update(data[key])
+            data = load_yaml_file(filepath)
+            if data and key in data:
+                if isinstance(data[key], dict):
+                    merged_dict.update(data[key])
         except Exception as e:
             click.echo(f"Warning: Failed to load {filepath}: {e}", err=True)
 
@@ -171,34 +302,69 @@ def get_timestamp_format() -> str:
     return get_config_value("logging.timestamp_format", "%Y%m%d_%H%M%S_%f")
 
 
-def format_timestamp(dt) -> str:
+@lru_cache(maxsize=4)
+def _split_microsecond_directives(timestamp_format: str) -> tuple:
+    """Split a strftime format around its %f directives, leaving escaped %% alone."""
+    parts = []
+    start = i = 0
+    while i < len(timestamp_format) - 1:
+        if timestamp_format[i] == "%":
+            if timestamp_format[i + 1] == "f":
+                parts.append(timestamp_format[start:i])
+                start = i + 2
+            i += 2
+        else:
+            i += 1
+    parts.append(timestamp_format[start:])
+    return tuple(parts)
+
+
+def format_timestamp(dt=None, timestamp_format: Optional[str] = None) -> str:
     """
     Format a datetime object using the configured timestamp format.
 
     Args:
-        dt: datetime object to format
+        dt: datetime object to format; defaults to the current local time,
+            formatted from time.localtime() without building a datetime
+        timestamp_format: Format to use; callers formatting repeatedly can pass
+            get_timestamp_format() once instead of per call
 
     Returns:
         Formatted timestamp string
     """
-    return dt.strftime(get_timestamp_format())
-
-
-def parse_timestamp(timestamp_str: str):
+    if timestamp_format is None:
+        timestamp_format = get_timestamp_format()
+    if dt is not None:
+        return dt.strftime(timestamp_format)
+
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    parts = _split_microsecond_directives(timestamp_format)
+    local_time = time.localtime(seconds)
+    if len(parts) == 1:
+        return time.strftime(timestamp_format, local_time)
+    # time.strftime has no microseconds directive, so format around each %f
+    microseconds = f"{nanoseconds // 1000:06d}"
+    return microseconds.join(time.strftime(part, local_time) if part else "" for part in parts)
+
+
+def parse_timestamp(timestamp_str: str, timestamp_format: Optional[str] = None):
     """
     Parse a timestamp string using the configured format.
 
     Args:
         timestamp_str: Timestamp string to parse
+        timestamp_format: Format to parse with; callers parsing many values in a
+            loop can pass get_timestamp_format() once instead of per call
 
     Returns:
         datetime object, or None if parsing fails
     """
     from datetime import datetime
 
+    # Remove .log extension if present
+    if timestamp_str.endswith(".log"):
+        timestamp_str = timestamp_str[:-4]
     try:
-        # Remove .log extension if present
-        timestamp_str = timestamp_str.replace(".log", "")
-        return datetime.strptime(timestamp_str, get_timestamp_format())
+        return datetime.strptime(timestamp_str, timestamp_format or get_timestamp_format())
     except ValueError:
         return None
@@ -1,82 +1,152 @@
 # Log management functionality for signalbox
 
+import heapq
+import io
 import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from .config import get_config_value
-from .helpers import format_timestamp
+from .config import get_config_value, resolve_path
+from .helpers import format_timestamp, MTIME_TICK_NS
 
 
 
+def get_log_root():
+    """Get the configured log directory, resolved against the config home if relative."""
+    # resolve_path memoizes the join per config home, so this is two dict lookups
+    return resolve_path(get_config_value("paths.log_dir", "logs"))
+
+
 def get_task_log_dir(task_name):
     """Get the log directory path for a task, relative to config file directory."""
-    log_dir = get_config_value("paths.log_dir", "logs")
-    # Try to resolve log_dir relative to config home
-    from .config import _default_config_manager
-    config_home = _default_config_manager.find_config_home()
-    if not os.path.isabs(log_dir):
-        log_dir = os.path.join(config_home, log_dir)
-    return os.path.join(log_dir, task_name)
+    return os.path.join(get_log_root(), task_name)
+
 
 
+# Log directories already created (or found) by this process
+_ensured_log_dirs = set()
+
 
 def ensure_log_dir(task_name):
     """Ensure the log directory exists for a task."""
     task_log_dir = get_task_log_dir(task_name)
-    if not os.path.exists(task_log_dir):
-        os.makedirs(task_log_dir)
+    if task_log_dir in _ensured_log_dirs:
+        return
+    os.makedirs(task_log_dir, exist_ok=True)
+    _ensured_log_dirs.add(task_log_dir)
 
 
 
 def get_log_path(task_name, timestamp=None):
     """Get the full path for a log file, relative to config file directory."""
     if timestamp is None:
-        timestamp = format_timestamp(datetime.now())
-    log_dir = get_config_value("paths.log_dir", "logs")
-    from .config import _default_config_manager
-    config_home = _default_config_manager.find_config_home()
-    if not os.path.isabs(log_dir):
-        log_dir = os.path.join(config_home, log_dir)
-    return os.path.join(log_dir, task_name, f"{timestamp}.log")
+        timestamp = format_timestamp()
+    return os.path.join(get_log_root(), task_name, f"{timestamp}.log")
+
+
+# Captured output up to this size is written together with the log headers
+INLINE_OUTPUT_LIMIT = 64 * 1024
+
+
+def _as_output_stream(output):
+    """Return captured output as a binary stream, wrapping plain strings."""
+    if isinstance(output, str):
+        return io.BytesIO(output.encode("utf-8", errors="replace"))
+    return output
+
+
+def _stream_size(stream):
+    """Return the total size of a seekable binary stream in bytes."""
+    stream.seek(0, os.SEEK_END)
+    return stream.tell()
+
+
+def _copy_output(dst, src, size, half_size, truncation_msg):
+    """Copy captured output into the log, keeping only head and tail if it is too large."""
+    src.seek(0)
+    if half_size is None or size <= half_size:
+        shutil.copyfileobj(src, dst)
+        return
+
+    remaining = half_size
+    while remaining > 0:
+        chunk = src.read(min(remaining, 65536))
+        if not chunk:
+            break
+        dst.write(chunk)
+        remaining -= len(chunk)
+    dst.write(truncation_msg)
+    if half_size > 0:
+        src.seek(size - half_size)
+        shutil.copyfileobj(src, dst)
 
 
 def write_execution_log(log_file, command, return_code, stdout, stderr):
     """Write execution results to a log file.
 
+    The output is copied into the log in chunks, so captured output held in
+    temporary files never has to be read into memory as a whole.
+
     Args:
             log_file: Path to the log file
             command: The command that was executed
             return_code: Exit code from the command
-            stdout: Standard output from the command
-            stderr: Standard error from the command
+            stdout: Standard output from the command, as a string or seekable binary file
+            stderr: Standard error from the command, as a string or seekable binary file
     """
     # Security: Set restrictive permissions (owner read/write only)
     # This prevents other users from reading potentially sensitive log output
     import os
 
+    stdout = _as_output_stream(stdout)
+    stderr = _as_output_stream(stderr)
+    stdout_size = _stream_size(stdout)
+    stderr_size = _stream_size(stderr)
+
     # Check max log file size to prevent disk filling attacks
     max_log_size = get_config_value("logging.max_file_size_mb", 100) * 1024 * 1024
-    content_size = len(command) + len(str(return_code)) + len(stdout) + len(stderr)
+    content_size = len(command) + len(str(return_code)) + stdout_size + stderr_size
 
+    half_size = None
+    truncation_msg = b""
     if content_size > max_log_size:
         # Truncate output if too large
-        truncation_msg = f"\n\n[OUTPUT TRUNCATED - exceeded {max_log_size / (1024*1024):.1f}MB limit]\n"
+        truncation_msg = f"\n\n[OUTPUT TRUNCATED - exceeded {max_log_size / (1024*1024):.1f}MB limit]\n".encode()
         remaining_size = max_log_size - len(command) - len(str(return_code)) - len(truncation_msg)
-        half_size = remaining_size // 2
-        stdout = stdout[:half_size] + truncation_msg + stdout[-half_size:] if len(stdout) > half_size else stdout
-        stderr = stderr[:half_size] + truncation_msg + stderr[-half_size:] if len(stderr) > half_size else stderr
-
-    with open(log_file, "w") as f:
-        if get_config_value("logging.include_command", True):
-            f.write(f"Command: {command}\n")
-
-        if get_config_value("logging.include_return_code", True):
-            f.write(f"Return code: {return_code}\n")
-
-        if get_config_value("execution.capture_stdout", True):
-            f.write("STDOUT:\n" + stdout + "\n")
-
-        if get_config_value("execution.capture_stderr", True):
-            f.write("STDERR:\n" + stderr + "\n")
+        half_size = max(int(remaining_size) // 2, 0)
+
+    parts = []
+    if get_config_value("logging.include_command", True):
+        parts.append(f"Command: {command}\n".encode())
+
+    if get_config_value("logging.include_return_code", True):
+        parts.append(f"Return code: {return_code}\n".encode())
+
+    sections = []
+    if get_config_value("execution.capture_stdout", True):
+        sections.append((b"STDOUT:\n", stdout, stdout_size))
+
+    if get_config_value("execution.capture_stderr", True):
+        sections.append((b"STDERR:\n", stderr, stderr_size))
+
+    # Small outputs are joined with the headers into a single write; only
+    # large or truncated output is streamed into the file on its own. The
+    # 64 KiB buffer coalesces the section titles and the streamed chunks
+    with open(log_file, "wb", buffering=65536) as f:
+        for title, stream, size in sections:
+            parts.append(title)
+            if half_size is None and size <= INLINE_OUTPUT_LIMIT:
+                stream.seek(0)
+                parts.append(stream.read())
+            else:
+                f.write(b"".join(parts))
+                parts = []
+                _copy_output(f, stream, size, half_size, truncation_msg)
+            parts.append(b"\n")
+        f.write(b"".join(parts))
 
     # Set secure permissions: 0o600 (owner read/write only)
     os.chmod(log_file, 0o600)
@@ -98,9 +168,6 @@ def rotate_logs(task):
     name = task["name"]
     task_log_dir = get_task_log_dir(name)
 
-    if not os.path.exists(task_log_dir):
-        return
-
     # Security: Use file locking to prevent race conditions
     # Multiple concurrent executions could corrupt log rotation
     lock_file = os.path.join(tempfile.gettempdir(), f"signalbox_rotate_{name}.lock")
@@ -118,12 +185,15 @@ def rotate_logs(task):
             default_limit = get_config_value("default_log_limit", {"type": "count", "value": 10})
             log_limit = task.get("log_limit", default_limit)
 
-            log_files = os.listdir(task_log_dir)
+            try:
+                log_entries = _scan_log_files(task_log_dir)
+            except FileNotFoundError:
+                return
 
             if log_limit["type"] == "count":
-                _rotate_by_count(task_log_dir, log_files, log_limit["value"])
+                _rotate_by_count(log_entries, log_limit["value"])
             elif log_limit["type"] == "age":
-                _rotate_by_age(task_log_dir, log_files, log_limit["value"])
+                _rotate_by_age(log_entries, log_limit["value"])
 
             # Lock is automatically released when file is closed
     except Exception as e:
@@ -133,41 +203,89 @@ def rotate_logs(task):
         click.echo(f"Warning: Log rotation failed for {name}: {e}", err=True)
 
 
-def _rotate_by_count(task_log_dir, log_files, max_count):
+def _scan_log_files(task_log_dir):
+    """List the regular files in a log directory with their modification times.
+
+    One scandir pass; DirEntry.stat() reuses the data from the directory read
+    where the platform provides it, so no separate stat per file is needed.
+
+    Returns:
+            list: (mtime, path) tuples in directory order
+    """
+    with os.scandir(task_log_dir) as it:
+        return [(entry.stat().st_mtime, entry.path) for entry in it if entry.is_file()]
+
+
+# Newest-first listings per log directory, keyed by the directory's mtime and
+# size. Adding or removing a log changes the directory mtime, so an unchanged
+# stamp means the listing is still current. Log files are written once, so
+# their own mtimes don't move afterwards.
+_LOG_SCAN_CACHE_SIZE = 64
+_log_scan_cache = OrderedDict()
+_log_scan_cache_lock = threading.Lock()
+
+
+def _scan_log_dir(task_log_dir):
+    """Return (mtime, path) tuples for a task's logs, newest first, or None if the directory is missing.
+
+    Read-only callers share this so repeated lookups (e.g. `log tail` polling
+    for a first log) cost one stat on the directory instead of a full scan.
+    """
+    try:
+        st = os.stat(task_log_dir)
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    with _log_scan_cache_lock:
+        hit = _log_scan_cache.get(task_log_dir)
+        if hit is not None and hit[0] == stamp:
+            _log_scan_cache.move_to_end(task_log_dir)
+            return list(hit[1])
+
+    scan_started = time.time_ns()
+    log_entries = sorted(_scan_log_files(task_log_dir), reverse=True)
+    with _log_scan_cache_lock:
+        # A log created in the same tick as the scan leaves the mtime unchanged
+        if st.st_mtime_ns < scan_started - MTIME_TICK_NS:
+            _log_scan_cache[task_log_dir] = (stamp, log_entries)
+            _log_scan_cache.move_to_end(task_log_dir)
+            while len(_log_scan_cache) > _LOG_SCAN_CACHE_SIZE:
+                _log_scan_cache.popitem(last=False)
+        else:
+            _log_scan_cache.pop(task_log_dir, None)
+    return list(log_entries)
+
+
+def _rotate_by_count(log_entries, max_count):
     """Keep only the most recent N log files.
 
     Args:
-            task_log_dir: Directory containing log files
-            log_files: List of log filenames
+            log_entries: (mtime, path) tuples from _scan_log_files
             max_count: Maximum number of log files to keep
     """
-    if len(log_files) <= max_count:
+    excess = len(log_entries) - max_count
+    if excess <= 0 or max_count <= 0:
         return
 
-    # Sort by modification time (oldest first)
-    log_files.sort(key=lambda x: os.path.getmtime(os.path.join(task_log_dir, x)))
+    # Only the oldest few need to go in steady state, so select them with a
+    # bounded heap (oldest first) instead of sorting the whole directory
+    to_delete = heapq.nsmallest(excess, log_entries)
+    for _, filepath in to_delete:
+        os.remove(filepath)
 
-    # Delete oldest files to keep only max_count
-    to_delete = log_files[:-max_count]
-    for filename in to_delete:
-        os.remove(os.path.join(task_log_dir, filename))
 
-
-def _rotate_by_age(task_log_dir, log_files, max_age_days):
+def _rotate_by_age(log_entries, max_age_days):
     """Delete log files older than N days.
 
     Args:
-            task_log_dir: Directory containing log files
-            log_files: List of log filenames
+            log_entries: (mtime, path) tuples from _scan_log_files
             max_age_days: Maximum age of log files in days
     """
-    cutoff = datetime.now() - timedelta(days=max_age_days)
-
-    for filename in log_files:
-        filepath = os.path.join(task_log_dir, filename)
-        file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).timestamp()
 
-        if file_time < cutoff:
+    for mtime, filepath in log_entries:
+        if mtime < cutoff:
             os.remove(filepath)
 
 
@@ -178,36 +296,41 @@ def get_latest_log(task_name):
             tuple: (log_path, log_exists) where log_path is the path to the latest log
                    and log_exists is True if logs were found
     """
-    task_log_dir = get_task_log_dir(task_name)
-
-    if not os.path.exists(task_log_dir):
-        return None, False
-
-    log_files = os.listdir(task_log_dir)
-    if not log_files:
+    log_entries = _scan_log_dir(get_task_log_dir(task_name))
+    if not log_entries:
         return None, False
 
-    latest = max(log_files, key=lambda x: os.path.getmtime(os.path.join(task_log_dir, x)))
-    return os.path.join(task_log_dir, latest), True
+    return log_entries[0][1], True
 
 
 def read_log_content(log_path):
     """Read the content of a log file."""
-    with open(log_path, "r") as f:
+    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
         return f.read()
 
 
-def format_log_with_colors(content, show_colors=True):
-    """Format log content with color coding.
+# Any of the markers format_log_with_colors colours by
+_LOG_MARKER_RE = re.compile(r"\[(?:ERROR|SUCCESS|START)\]|exit_code:")
 
-    Returns:
-            list: List of tuples (line_text, color) where color can be 'red', 'green', 'blue', or None
-    """
-    formatted_lines = []
 
-    for line in content.split("\n"):
+def iter_log_lines(log_path):
+    """Yield the lines of a log file without their newlines, reading it incrementally."""
+    with open(log_path, "r", buffering=1 << 20, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def iter_log_with_colors(lines, show_colors=True):
+    """Yield (line_text, color) for each line, as format_log_with_colors does.
+
+    Accepts any iterable of lines (e.g. iter_log_lines), so a log can be
+    classified and displayed without holding the whole file in memory.
+    """
+    for line in lines:
         color = None
-        if show_colors:
+        # Most lines carry no marker at all; one regex search rules them out
+        # before the ordered checks below decide between the markers
+        if show_colors and _LOG_MARKER_RE.search(line):
             if "[ERROR]" in line or ("exit_code:" in line and "exit_code: 0" not in line):
                 color = "red"
             elif "[SUCCESS]" in line or "exit_code: 0" in line:
@@ -215,9 +338,16 @@ def format_log_with_colors(content, show_colors=True):
             elif "[START]" in line:
                 color = "blue"
 
-        formatted_lines.append((line, color))
+        yield line, color
+
+
+def format_log_with_colors(content, show_colors=True):
+    """Format log content with color coding.
 
-    return formatted_lines
+    Returns:
+            list: List of tuples (line_text, color) where color can be 'red', 'green', 'blue', or None
+    """
+    return list(iter_log_with_colors(content.split("\n"), show_colors))
 
 
 def get_log_history(task_name):
@@ -227,23 +357,12 @@ def get_log_history(task_name):
             tuple: (log_files_info, history_exists) where log_files_info is a list of
                    tuples (filename, timestamp) sorted newest first
     """
-    task_log_dir = get_task_log_dir(task_name)
-
-    if not os.path.exists(task_log_dir):
-        return [], False
-
-    log_files = os.listdir(task_log_dir)
-    if not log_files:
+    # Already sorted by time, newest first
+    log_entries = _scan_log_dir(get_task_log_dir(task_name))
+    if not log_entries:
         return [], False
 
-    # Sort by time, newest first
-    log_files.sort(key=lambda x: os.path.getmtime(os.path.join(task_log_dir, x)), reverse=True)
-
-    log_info = []
-    for filename in log_files:
-        mtime = os.path.getmtime(os.path.join(task_log_dir, filename))
-        log_info.append((filename, mtime))
-
+    log_info = [(os.path.basename(filepath), mtime) for mtime, filepath in log_entries]
     return log_info, True
 
 
@@ -255,14 +374,17 @@ def clear_task_logs(task_name):
     """
     task_log_dir = get_task_log_dir(task_name)
 
-    if not os.path.exists(task_log_dir):
+    # Opening the directory doubles as the existence check
+    try:
+        with os.scandir(task_log_dir) as it:
+            entries = list(it)
+    except FileNotFoundError:
         return False
 
     # Delete files but keep directory
-    for filename in os.listdir(task_log_dir):
-        filepath = os.path.join(task_log_dir, filename)
-        if os.path.isfile(filepath):
-            os.remove(filepath)
+    for entry in entries:
+        if entry.is_file(follow_symlinks=False):
+            os.remove(entry.path)
 
     return True
 
@@ -273,19 +395,37 @@ def clear_all_logs():
     Returns:
             bool: True if log directory was found and cleared, False otherwise
     """
-    log_dir = get_config_value("paths.log_dir", "logs")
+    log_dir = get_log_root()
 
-    if not os.path.exists(log_dir):
+    try:
+        filepaths = list(_iter_log_files(log_dir))
+    except FileNotFoundError:
         return False
 
     # Recursively delete files but keep directories
-    for root, dirs, files in os.walk(log_dir):
-        for filename in files:
-            os.remove(os.path.join(root, filename))
+    for filepath in filepaths:
+        os.unlink(filepath)
 
     return True
 
 
+def _iter_log_files(directory):
+    """Yield the path of every non-directory entry under directory, recursively.
+
+    Like os.walk, symlinked directories are neither descended into nor yielded.
+    DirEntry carries the path and file type from the directory read, so there
+    is no join or stat per file.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                yield from _iter_log_files(entry.path)
+        else:
+            yield entry.path
+
+
 def get_all_log_files():
     """Get all log files from all tasks with metadata.
     
@@ -293,28 +433,30 @@ def get_all_log_files():
         list: List of dicts with task, log_file, timestamp, path
     """
     from .helpers import parse_timestamp
-    log_dir = get_config_value("paths.log_dir", "logs")
+    log_dir = get_log_root()
     
-    if not os.path.exists(log_dir):
+    try:
+        with os.scandir(log_dir) as task_dirs:
+            task_entries = [entry for entry in task_dirs if entry.is_dir()]
+    except FileNotFoundError:
         return []
     
     logs = []
-    for task_name in os.listdir(log_dir):
-        task_log_dir = os.path.join(log_dir, task_name)
-        if not os.path.isdir(task_log_dir):
-            continue
-            
-        for log_file in os.listdir(task_log_dir):
-            if not log_file.endswith('.log'):
-                continue
-                
-            log_path = os.path.join(task_log_dir, log_file)
+
+    for task_entry in task_entries:
+        task_name = task_entry.name
+        with os.scandir(task_entry.path) as it:
+            log_entries = [entry for entry in it if entry.name.endswith('.log')]
+
+        for entry in log_entries:
+            log_file = entry.name
+            log_path = entry.path
             timestamp_str = log_file.replace('.log', '')
+            mtime = entry.stat().st_mtime
             
-            try:
-                timestamp = parse_timestamp(timestamp_str)
-            except:
-                timestamp = datetime.fromtimestamp(os.path.getmtime(log_path))
+            timestamp = parse_timestamp(timestamp_str)
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(mtime)
             
             logs.append({
                 'task': task_name,
@@ -322,12 +464,55 @@ def get_all_log_files():
                 'timestamp': timestamp,
                 'timestamp_str': timestamp_str,
                 'path': log_path,
-                'mtime': os.path.getmtime(log_path)
+                'mtime': mtime
             })
     
     return logs
 
 
+# write_execution_log puts the Command:/Return code: lines before any output,
+# so metadata only needs the start of the file, read in chunks of this size up
+# to a fixed limit (files without an output section are not read to the end)
+_LOG_HEADER_CHUNK = 4096
+_LOG_HEADER_LIMIT = 64 * 1024
+_LOG_SECTION_MARKERS = (b'STDOUT:\n', b'STDERR:\n')
+# Bytes of the previous read searched again, for a marker split across reads
+_LOG_MARKER_OVERLAP = len(_LOG_SECTION_MARKERS[0]) - 1
+
+
+def _read_log_header(f):
+    """Read a binary log file from the start up to its first output section.
+
+    Stops at EOF or after _LOG_HEADER_LIMIT bytes if there is no section.
+    """
+    head = bytearray()
+    while len(head) < _LOG_HEADER_LIMIT:
+        chunk = f.read(_LOG_HEADER_CHUNK)
+        if not chunk:
+            break
+        # Only the new bytes (plus the overlap) can hold a marker not seen yet
+        start = max(len(head) - _LOG_MARKER_OVERLAP, 0)
+        head += chunk
+        ends = [pos for pos in (head.find(marker, start) for marker in _LOG_SECTION_MARKERS) if pos >= 0]
+        if ends:
+            del head[min(ends):]
+            break
+    return bytes(head)
+
+
+def _log_header_field(head, prefix):
+    """Return the rest of the first line in head that starts with prefix, or None."""
+    if head.startswith(prefix):
+        start = len(prefix)
+    else:
+        pos = head.find(b'\n' + prefix)
+        if pos < 0:
+            return None
+        start = pos + 1 + len(prefix)
+    end = head.find(b'\n', start)
+    return head[start:end if end >= 0 else len(head)]
+
+
 def parse_log_metadata(log_path):
     """Parse log file to extract status and metadata.
     
@@ -344,30 +529,24 @@ def parse_log_metadata(log_path):
         'command': None
     }
     
-    if not os.path.exists(log_path):
-        return metadata
-    
+    # A missing file lands in the except below, like any other read error
     try:
-        with open(log_path, 'r') as f:
-            content = f.read()
-            
+        with open(log_path, 'rb') as f:
+            head = _read_log_header(f)
+        
         # Parse return code
-        if 'Return code: ' in content:
-            for line in content.split('\n'):
-                if line.startswith('Return code: '):
-                    try:
-                        metadata['return_code'] = int(line.split(': ')[1])
-                        metadata['status'] = 'success' if metadata['return_code'] == 0 else 'failed'
-                    except:
-                        pass
-                    break
+        return_code = _log_header_field(head, b'Return code: ')
+        if return_code is not None:
+            try:
+                metadata['return_code'] = int(return_code)
+                metadata['status'] = 'success' if metadata['return_code'] == 0 else 'failed'
+            except ValueError:
+                pass
         
         # Parse command
-        if 'Command: ' in content:
-            for line in content.split('\n'):
-                if line.startswith('Command: '):
-                    metadata['command'] = line.split(': ', 1)[1]
-                    break
+        command = _log_header_field(head, b'Command: ')
+        if command is not None:
+            metadata['command'] = command.decode('utf-8', 'replace')
                     
     except Exception:
         pass
@@ -391,33 +570,35 @@ def filter_logs(logs, task=None, status=None, since=None, until=None, limit=None
     """
     filtered = logs
     
-    if task:
-        filtered = [l for l in filtered if l['task'] == task]
-    
-    if since:
-        filtered = [l for l in filtered if l['timestamp'] >= since]
+    # Apply task and date bounds in a single pass over the entries
+    if task or since or until:
+        filtered = [
+            l for l in filtered
+            if (not task or l['task'] == task)
+            and (not since or l['timestamp'] >= since)
+            and (not until or l['timestamp'] <= until)
+        ]
     
-    if until:
-        filtered = [l for l in filtered if l['timestamp'] <= until]
+    # Sort by timestamp descending (newest first) before reading any log, so
+    # only the files that can still make it into the result are opened
+    filtered = sorted(filtered, key=lambda x: x['timestamp'], reverse=True)
     
     if status:
-        # Need to parse each log to check status
+        # Need to parse each log to check status; stop once limit matches are found
         filtered_with_status = []
         for log_entry in filtered:
             metadata = parse_log_metadata(log_entry['path'])
             log_entry['metadata'] = metadata
             if metadata['status'] == status:
                 filtered_with_status.append(log_entry)
+                if limit and len(filtered_with_status) >= limit:
+                    break
         filtered = filtered_with_status
     else:
-        # Add metadata to all logs
+        if limit:
+            filtered = filtered[:limit]
+        # Add metadata to the logs being returned
         for log_entry in filtered:
             log_entry['metadata'] = parse_log_metadata(log_entry['path'])
     
-    # Sort by timestamp descending (newest first)
-    filtered.sort(key=lambda x: x['timestamp'], reverse=True)
-    
-    if limit:
-        filtered = filtered[:limit]
-    
     return filtered
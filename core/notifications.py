@@ -5,6 +5,7 @@ Supports macOS (via osascript) and Linux (via notify-send).
 Falls back gracefully if notification systems are unavailable.
 """
 
+import functools
 import platform
 import subprocess
 import logging
@@ -12,6 +13,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def get_system():
+    """Return the name of the running OS (e.g. "Linux", "Darwin"), computed once per process."""
+    return platform.system()
+
+
 def send_notification(title, message, urgency="normal"):
     """
     Send a desktop notification.
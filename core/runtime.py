@@ -1,8 +1,13 @@
 # Runtime state management for signalbox
 import os
+import threading
 import yaml
 from .config import resolve_path
-from .helpers import load_yaml_dict_from_dir
+from .helpers import load_yaml_dict_from_dir, write_yaml_file_atomic, YAML_LOADER
+
+# Serializes read-modify-write of runtime files between parallel task runs,
+# so one task's update never drops another's from the same file
+_runtime_write_lock = threading.Lock()
 
 
 def load_runtime_state():
@@ -26,20 +31,23 @@ def save_task_runtime_state(task_name, source_file, last_run, last_status):
     config_basename = os.path.splitext(config_filename)[0]
     runtime_filename = f"runtime_{config_basename}.yaml"
     runtime_filepath = resolve_path(os.path.join("runtime/tasks", runtime_filename))
-    runtime_data = {"tasks": {}}
-    if os.path.exists(runtime_filepath):
-        try:
-            with open(runtime_filepath, "r") as f:
-                runtime_data = yaml.safe_load(f) or {"tasks": {}}
-        except Exception:
-            runtime_data = {"tasks": {}}
-    if "tasks" not in runtime_data:
-        runtime_data["tasks"] = {}
-    runtime_data["tasks"][task_name] = {"last_run": last_run, "last_status": last_status}
-    os.makedirs(os.path.dirname(runtime_filepath), exist_ok=True)
-    with open(runtime_filepath, "w") as f:
-        f.write(f"# Runtime state for {config_filename} - auto-generated, do not edit manually\n")
-        yaml.dump(runtime_data, f, default_flow_style=False, sort_keys=False)
+    with _runtime_write_lock:
+        runtime_data = {"tasks": {}}
+        if os.path.exists(runtime_filepath):
+            try:
+                with open(runtime_filepath, "rb", buffering=0) as f:
+                    runtime_data = yaml.load(f.read(), Loader=YAML_LOADER) or {"tasks": {}}
+            except Exception:
+                runtime_data = {"tasks": {}}
+        if "tasks" not in runtime_data:
+            runtime_data["tasks"] = {}
+        runtime_data["tasks"][task_name] = {"last_run": last_run, "last_status": last_status}
+        os.makedirs(os.path.dirname(runtime_filepath), exist_ok=True)
+        write_yaml_file_atomic(
+            runtime_filepath,
+            runtime_data,
+            header=f"# Runtime state for {config_filename} - auto-generated, do not edit manually\n",
+        )
 
 
 def save_group_runtime_state(
@@ -50,30 +58,33 @@ def save_group_runtime_state(
     config_basename = os.path.splitext(config_filename)[0]
     runtime_filename = f"runtime_{config_basename}.yaml"
     runtime_filepath = resolve_path(os.path.join("runtime/groups", runtime_filename))
-    runtime_data = {"groups": {}}
-    if os.path.exists(runtime_filepath):
-        try:
-            with open(runtime_filepath, "r") as f:
-                runtime_data = yaml.safe_load(f) or {"groups": {}}
-        except Exception:
-            runtime_data = {"groups": {}}
-    if "groups" not in runtime_data:
-        runtime_data["groups"] = {}
-    prev_state = runtime_data["groups"].get(group_name, {})
-    execution_count = prev_state.get("execution_count", 0) + 1
-    runtime_data["groups"][group_name] = {
-        "last_run": last_run,
-        "last_status": last_status,
-        "execution_time_seconds": execution_time,
-        "execution_count": execution_count,
-        "tasks_total": tasks_total,
-        "tasks_successful": tasks_successful,
-        "success_rate": round((tasks_successful / tasks_total * 100), 1) if tasks_total > 0 else 0.0,
-    }
-    os.makedirs(os.path.dirname(runtime_filepath), exist_ok=True)
-    with open(runtime_filepath, "w") as f:
-        f.write(f"# Runtime state for {config_filename} - auto-generated, do not edit manually\n")
-        yaml.dump(runtime_data, f, default_flow_style=False, sort_keys=False)
+    with _runtime_write_lock:
+        runtime_data = {"groups": {}}
+        if os.path.exists(runtime_filepath):
+            try:
+                with open(runtime_filepath, "rb", buffering=0) as f:
+                    runtime_data = yaml.load(f.read(), Loader=YAML_LOADER) or {"groups": {}}
+            except Exception:
+                runtime_data = {"groups": {}}
+        if "groups" not in runtime_data:
+            runtime_data["groups"] = {}
+        prev_state = runtime_data["groups"].get(group_name, {})
+        execution_count = prev_state.get("execution_count", 0) + 1
+        runtime_data["groups"][group_name] = {
+            "last_run": last_run,
+            "last_status": last_status,
+            "execution_time_seconds": execution_time,
+            "execution_count": execution_count,
+            "tasks_total": tasks_total,
+            "tasks_successful": tasks_successful,
+            "success_rate": round((tasks_successful / tasks_total * 100), 1) if tasks_total > 0 else 0.0,
+        }
+        os.makedirs(os.path.dirname(runtime_filepath), exist_ok=True)
+        write_yaml_file_atomic(
+            runtime_filepath,
+            runtime_data,
+            header=f"# Runtime state for {config_filename} - auto-generated, do not edit manually\n",
+        )
 
 
 def merge_config_with_runtime_state(config, runtime_state):
@@ -3,6 +3,7 @@
 import os
 import yaml
 from .config import load_config, get_config_value, load_global_config, resolve_path
+from .helpers import load_yaml_file
 
 
 class ValidationResult:
@@ -59,8 +60,7 @@ def validate_configuration(include_catalog=True):
                         fpath = os.path.join(task_dir, fname)
                         file_errors = []
                         try:
-                            with open(fpath, "r") as f:
-                                data = yaml.safe_load(f)
+                            data = load_yaml_file(fpath)
                             if not data or "tasks" not in data:
                                 file_errors.append("No 'tasks' key found")
                             else:
@@ -126,8 +126,7 @@ def validate_configuration(include_catalog=True):
                         fpath = os.path.join(group_dir, fname)
                         file_errors = []
                         try:
-                            with open(fpath, "r") as f:
-                                data = yaml.safe_load(f)
+                            data = load_yaml_file(fpath)
                             if not data or "groups" not in data:
                                 file_errors.append("No 'groups' key found")
                             else:
@@ -178,8 +177,7 @@ def validate_configuration(include_catalog=True):
                 if fname.endswith(".yaml") or fname.endswith(".yml"):
                     fpath = os.path.join(catalog_tasks_file, fname)
                     try:
-                        with open(fpath, "r") as f:
-                            catalog_data = yaml.safe_load(f) or {}
+                        catalog_data = load_yaml_file(fpath) or {}
                         if "tasks" in catalog_data:
                             result.config["tasks"].extend(catalog_data["tasks"])
                         result.files_used.append(fpath)
@@ -191,8 +189,7 @@ def validate_configuration(include_catalog=True):
                     if fname.endswith(".yaml") or fname.endswith(".yml"):
                         fpath = os.path.join(catalog_groups_file, fname)
                         try:
-                            with open(fpath, "r") as f:
-                                catalog_data = yaml.safe_load(f) or {}
+                            catalog_data = load_yaml_file(fpath) or {}
                             if "groups" in catalog_data:
                                 if "groups" not in result.config:
                                     result.config["groups"] = []
@@ -238,8 +235,7 @@ def validate_configuration(include_catalog=True):
                     if fname.endswith(".yaml") or fname.endswith(".yml"):
                         fpath = os.path.join(catalog_tasks_file, fname)
                         try:
-                            with open(fpath, "r") as f:
-                                catalog_data = yaml.safe_load(f) or {}
+                            catalog_data = load_yaml_file(fpath) or {}
                             if "tasks" in catalog_data:
                                 for task in catalog_data["tasks"]:
                                     if "name" not in task:
@@ -262,8 +258,7 @@ def validate_configuration(include_catalog=True):
                     if fname.endswith(".yaml") or fname.endswith(".yml"):
                         fpath = os.path.join(catalog_groups_file, fname)
                         try:
-                            with open(fpath, "r") as f:
-                                catalog_data = yaml.safe_load(f) or {}
+                            catalog_data = load_yaml_file(fpath) or {}
                             if "groups" in catalog_data:
                                 for group in catalog_data["groups"]:
                                     if "name" not in group:
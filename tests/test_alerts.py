@@ -39,6 +39,24 @@ def test_check_alert_patterns_and_save(tmp_path, monkeypatch):
     assert "Disk usage is above 80%" in lines[0]
 
 
+def test_check_alert_patterns_uses_precompiled(monkeypatch):
+    import re
+    task_config = {"alerts": [{"pattern": "ERROR", "message": "error seen"}]}
+    compiled = [(re.compile("fail(ed)?"), {"pattern": "fail(ed)?", "message": "failed"})]
+
+    triggered = alerts.check_alert_patterns("t", task_config, "job failed", compiled)
+
+    assert [a["message"] for a in triggered] == ["failed"]
+
+
+def test_check_alert_patterns_searches_each_stream():
+    task_config = {"alerts": [{"pattern": "WARN", "message": "warned"}, {"pattern": "missing"}]}
+
+    triggered = alerts.check_alert_patterns("t", task_config, ["all good", "WARN: low disk"])
+
+    assert [a["message"] for a in triggered] == ["warned"]
+
+
 def test_load_alerts_filtering(tmp_path, monkeypatch):
 
     pass
@@ -338,8 +338,8 @@ class TestLogsCommand:
 
     @patch("core.cli_commands.load_config")
     @patch("core.cli_commands.log_manager.get_latest_log")
-    @patch("core.cli_commands.log_manager.read_log_content")
-    @patch("core.cli_commands.log_manager.format_log_with_colors")
+    @patch("core.cli_commands.log_manager.iter_log_lines")
+    @patch("core.cli_commands.log_manager.iter_log_with_colors")
     @patch("core.cli_commands.get_config_value")
     def test_logs_displays_latest_log(
         self, mock_get_config, mock_format, mock_read, mock_get_log, mock_load, runner, sample_config
@@ -347,8 +347,8 @@ class TestLogsCommand:
         """Test logs command displays latest log."""
         mock_load.return_value = sample_config
         mock_get_log.return_value = ("/path/to/log.txt", True)
-        mock_read.return_value = "Log content"
-        mock_format.return_value = [("Log content", None)]
+        mock_read.return_value = iter(["Log content"])
+        mock_format.return_value = iter([("Log content", None)])
         mock_get_config.return_value = False
 
         result = runner.invoke(logs, ["test_task"])
@@ -0,0 +1,54 @@
+"""
+Tests for the shared Rich table printer in core.cli_output_common.
+"""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from core import cli_output_common
+from core.cli_output import TASK_LIST_COLUMNS
+from core.cli_output_common import FIXED_WIDTH_MIN_ROWS, RunResultRow, TaskRow, render_status_table
+from core.cli_output_run import RUN_RESULT_COLUMNS
+
+
+def _render(monkeypatch, columns, rows, width):
+    console = Console(file=io.StringIO(), width=width)
+    monkeypatch.setattr(cli_output_common, "CONSOLE", console)
+    render_status_table(columns, rows)
+    return console.file.getvalue()
+
+
+@pytest.mark.parametrize(
+    "columns, make_row, width",
+    [
+        (
+            TASK_LIST_COLUMNS,
+            lambda i: TaskRow(f"task{i}", "success", "20240101_000000", "d" * 120, "config/tasks/long/path.yaml"),
+            80,
+        ),
+        (
+            RUN_RESULT_COLUMNS,
+            lambda i: RunResultRow(f"task{i}", "success", f"/var/log/{i}.log", "e" * 200),
+            100,
+        ),
+    ],
+)
+def test_large_narrow_table_keeps_headers_readable(monkeypatch, columns, make_row, width):
+    """A table past the fixed-width threshold still fits its short columns when squeezed."""
+    output = _render(monkeypatch, columns, [make_row(i) for i in range(FIXED_WIDTH_MIN_ROWS + 100)], width)
+
+    # Every header sits whole on the header line, not broken across lines
+    header = output.splitlines()[1]
+    for column in columns:
+        assert column[0] in header
+
+
+def test_large_table_that_fits_gets_fixed_widths(monkeypatch):
+    rows = [RunResultRow(f"task{i}", "success", "/x.log", "") for i in range(FIXED_WIDTH_MIN_ROWS + 1)]
+    output = _render(monkeypatch, RUN_RESULT_COLUMNS, rows, 100)
+
+    lines = output.splitlines()
+    assert lines[1] == "┃ TASK    ┃ STATUS  ┃ LOG FILE ┃ ERROR ┃"
+    assert len(lines) == len(rows) + 4
@@ -1,3 +1,4 @@
+import json
 import os
 import yaml
 import pytest
@@ -20,6 +21,14 @@ from core.config import (
 )
 
 
+def _backdate(root, seconds=60):
+    """Move the mtime of every file and directory under root into the past."""
+    past = os.stat(root).st_mtime - seconds
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+
+
 class TestConfigManager:
     """Test the ConfigManager class."""
 
@@ -143,6 +152,15 @@ class TestResolvePath:
         expected = os.path.join(temp_config_dir, path)
         assert result == expected
 
+    def test_resolved_paths_follow_config_home(self, temp_config_dir, tmp_path):
+        """Test that cached resolutions are discarded when the config home changes."""
+        manager = ConfigManager(config_home=temp_config_dir)
+
+        assert manager.resolve_path("logs") == os.path.join(temp_config_dir, "logs")
+
+        manager._config_home = str(tmp_path)
+        assert manager.resolve_path("logs") == os.path.join(str(tmp_path), "logs")
+
 
 class TestLoadGlobalConfig:
     """Test loading global configuration from signalbox.yaml."""
@@ -255,6 +273,24 @@ class TestGetConfigValue:
         value = manager.get_config_value("execution.default_timeout.something", default="default")
         assert value == "default"
 
+    def test_cached_value_refreshes_when_config_reloads(self, full_config):
+        """Test that memoized lookups are dropped once the global config is replaced."""
+        manager = ConfigManager(config_home=full_config)
+
+        assert manager.get_config_value("execution.default_timeout") == 300
+        assert manager.get_config_value("missing.key", default="a") == "a"
+        assert manager.get_config_value("missing.key", default="b") == "b"
+
+        manager._global_config = {"execution": {"default_timeout": 10}}
+        assert manager.get_config_value("execution.default_timeout") == 10
+
+    def test_get_intermediate_dict_value(self, full_config):
+        """Test that a partial path returns the nested dict itself."""
+        manager = ConfigManager(config_home=full_config)
+
+        value = manager.get_config_value("default_log_limit")
+        assert value == {"type": "count", "value": 10}
+
 
 class TestLoadConfig:
     """Test loading scripts and groups configuration."""
@@ -286,6 +322,36 @@ class TestLoadConfig:
         assert "basic" in group_names
         assert "parallel_test" in group_names
 
+    def test_load_indexes_tasks_and_groups_by_name(self, full_config):
+        """Test that name indexes point at the same entries as the lists."""
+        manager = ConfigManager(config_home=full_config)
+
+        config = manager.load_config()
+
+        assert config["_tasks_by_name"]["hello"] is next(t for t in config["tasks"] if t["name"] == "hello")
+        assert config["_groups_by_name"]["basic"] is next(g for g in config["groups"] if g["name"] == "basic")
+
+    def test_load_compiles_alert_patterns(self, temp_config_dir, sample_signalbox_yaml):
+        """Test that alert patterns are compiled once at load time, beside the tasks."""
+        with open(os.path.join(temp_config_dir, "config/tasks/alerting.yaml"), "w") as f:
+            yaml.dump(
+                {
+                    "tasks": [
+                        {"name": "watch", "command": "true", "alerts": [{"pattern": "disk (full|low)"}]},
+                        {"name": "broken", "command": "true", "alerts": [{"pattern": "("}]},
+                    ]
+                },
+                f,
+            )
+        manager = ConfigManager(config_home=temp_config_dir)
+
+        config = manager.load_config()
+
+        [(regex, alert)] = config["_alert_patterns"]["watch"]
+        assert regex.search("disk low") and alert["pattern"] == "disk (full|low)"
+        assert "broken" not in config["_alert_patterns"]
+        assert all("_compiled" not in a for t in config["tasks"] for a in t.get("alerts", []))
+
     def test_load_tracks_task_sources(self, full_config):
         """Test that script source files are tracked."""
         manager = ConfigManager(config_home=full_config)
@@ -397,6 +463,66 @@ class TestLoadConfig:
         assert script_names == ["a_first", "m_middle", "z_last"]
 
 
+    def test_load_uses_cache_until_sources_change(self, full_config):
+        """Test that the config cache is reused and invalidated on edits."""
+        _backdate(full_config)
+        manager = ConfigManager(config_home=full_config)
+        config1 = manager.load_config()
+        assert (Path(full_config) / ".cache" / "config.json").exists()
+
+        with patch("core.config.iter_yaml_files_from_dir") as mock_load:
+            config2 = manager.load_config()
+            mock_load.assert_not_called()
+        assert config2 == config1
+
+        tasks_file = Path(full_config) / "config" / "tasks" / "system.yaml"
+        with open(tasks_file, "w") as f:
+            yaml.dump({"tasks": [{"name": "uptime2", "command": "uptime", "description": "changed"}]}, f)
+        config3 = manager.load_config()
+        assert "uptime2" in [t["name"] for t in config3["tasks"]]
+
+    def test_cached_config_rebuilds_indexes(self, full_config):
+        """Test that a config loaded from the cache gets fresh name indexes."""
+        _backdate(full_config)
+        manager = ConfigManager(config_home=full_config)
+        manager.load_config()
+        with patch("core.config.iter_yaml_files_from_dir") as mock_load:
+            config = manager.load_config()
+            mock_load.assert_not_called()
+        for task in config["tasks"]:
+            assert config["_tasks_by_name"][task["name"]] is task
+        assert "_alert_patterns" in config
+
+    def test_cache_with_other_version_is_ignored(self, full_config):
+        """Test that a cache written with a different format version is not used."""
+        _backdate(full_config)
+        manager = ConfigManager(config_home=full_config)
+        manager.load_config()
+        cache_file = Path(full_config) / ".cache" / "config.json"
+        cached = json.loads(cache_file.read_text())
+        cached["version"] = -1
+        cached["config"]["tasks"] = [{"name": "stale", "command": "true"}]
+        cache_file.write_text(json.dumps(cached))
+
+        config = manager.load_config()
+        assert "stale" not in [t["name"] for t in config["tasks"]]
+
+    def test_sources_modified_within_a_tick_are_not_cached(self, full_config):
+        """Test that a same-size rewrite keeping the mtime isn't served from the cache."""
+        manager = ConfigManager(config_home=full_config)
+        manager.load_config()
+        assert not (Path(full_config) / ".cache" / "config.json").exists()
+
+        # Coarse timestamps: a rewrite in the same tick keeps mtime and size
+        tasks_file = Path(full_config) / "config" / "tasks" / "system.yaml"
+        st = os.stat(tasks_file)
+        tasks_file.write_text(tasks_file.read_text().replace("uptime", "uptim2"))
+        os.utime(tasks_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        config = manager.load_config()
+        assert "uptim2" in [t["command"] for t in config["tasks"]]
+
+
 class TestSaveConfig:
     """Test saving configuration back to files."""
 
@@ -434,6 +560,20 @@ class TestSaveConfig:
         new_file = Path(full_config) / "config" / "tasks" / "_new.yaml"
         assert new_file.exists()
 
+    def test_save_skips_unchanged_files(self, full_config):
+        """Test that files whose data did not change are not rewritten."""
+        manager = ConfigManager(config_home=full_config)
+        config = manager.load_config()
+        manager.save_config(config)
+        hello_file = config["_task_sources"]["hello"]
+        before = os.stat(hello_file).st_mtime_ns
+
+        with patch("core.config.yaml.dump") as mock_dump:
+            manager.save_config(manager.load_config())
+
+        mock_dump.assert_not_called()
+        assert os.stat(hello_file).st_mtime_ns == before
+
 
 class TestModuleFunctions:
     """Test module-level convenience functions."""
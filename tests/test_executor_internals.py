@@ -0,0 +1,267 @@
+"""
+Tests for core.executor internals.
+
+Covers direct command execution and its shell fallback, and the shared
+worker pool behind parallel group runs, its per-thread console buffering,
+background log rotation, and stop_on_error in serial group runs.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core import executor
+from core.executor import _direct_argv, _run_command
+
+
+class TestDirectArgv:
+    """Tests for _direct_argv's shell-syntax detection."""
+
+    def test_plain_command_is_split(self):
+        assert _direct_argv("uptime -p") == ("uptime", "-p")
+
+    def test_shell_syntax_needs_shell(self):
+        assert _direct_argv("echo hi | wc -l") is None
+        assert _direct_argv("ls $HOME") is None
+        assert _direct_argv("FOO=1 env") is None
+
+    def test_builtins_need_shell(self):
+        assert _direct_argv("cd /tmp") is None
+        assert _direct_argv("echo hi") is None
+
+
+class TestRunCommand:
+    """Tests for _run_command's direct-exec path and shell fallback."""
+
+    def test_plain_command_runs_directly(self):
+        with patch("core.executor.subprocess.run", wraps=subprocess.run) as mock_run:
+            result = _run_command("true", subprocess.PIPE, subprocess.PIPE, 10)
+
+        assert result.returncode == 0
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args == (("true",),)
+        assert "shell" not in mock_run.call_args.kwargs
+
+    def test_script_without_shebang_falls_back_to_shell(self, tmp_path):
+        """A script with no #! line can't be exec'd (ENOEXEC) but /bin/sh runs it."""
+        script = tmp_path / "job.sh"
+        script.write_text("echo from-script\n")
+        script.chmod(0o755)
+
+        result = _run_command(str(script), subprocess.PIPE, subprocess.PIPE, 10)
+
+        assert result.returncode == 0
+        assert result.stdout == b"from-script\n"
+
+    def test_missing_program_falls_back_to_shell(self, tmp_path):
+        """A program that can't be found is reported by the shell, not raised."""
+        missing = str(tmp_path / "no-such-program")
+
+        result = _run_command(missing, subprocess.PIPE, subprocess.PIPE, 10)
+
+        assert result.returncode == 127
+
+
+@pytest.fixture
+def fake_group_run():
+    """Stub out task execution, settings and notifications for group runs."""
+    with patch("core.executor.run_task") as mock_run_task, \
+         patch("core.executor.snapshot_execution_settings"), \
+         patch("core.executor.get_config_value", side_effect=lambda key, default=None: default), \
+         patch("core.executor.notifications.notify_execution_result"):
+        yield mock_run_task
+    executor.shutdown_pool()
+
+
+class TestWorkerPool:
+    """Tests for the shared pool used by run_group_parallel."""
+
+    def test_results_are_in_task_order(self, fake_group_run):
+        # Earlier tasks take longer, so they finish last
+        delays = {"a": 0.15, "b": 0.1, "c": 0.05, "d": 0}
+
+        def run(name, config, settings, skip_validation):
+            time.sleep(delays[name])
+            return name != "c"
+
+        fake_group_run.side_effect = run
+        results = []
+        success_count = executor.run_group_parallel(["a", "b", "c", "d"], {}, results=results)
+
+        assert [name for name, _, _ in results] == ["a", "b", "c", "d"]
+        assert [success for _, success, _ in results] == [True, True, False, True]
+        assert success_count == 3
+
+    def test_pool_is_reused_across_runs(self, fake_group_run):
+        fake_group_run.return_value = True
+        executor.run_group_parallel(["a", "b"], {})
+        pool = executor._pool
+        executor.run_group_parallel(["c", "d"], {})
+        assert executor._pool is pool
+
+    def test_pool_grows_when_more_workers_are_needed(self, fake_group_run):
+        fake_group_run.return_value = True
+        executor.run_group_parallel(["a"], {})
+        small_pool = executor._pool
+        executor.run_group_parallel(["a", "b", "c"], {})
+        assert executor._pool is not small_pool
+        assert executor._pool_workers == 3
+
+    def test_shutdown_pool_resets_it(self, fake_group_run):
+        fake_group_run.return_value = True
+        executor.run_group_parallel(["a", "b"], {})
+        executor.shutdown_pool()
+        assert executor._pool is None
+        assert executor._pool_workers == 0
+
+        executor.run_group_parallel(["a", "b"], {})
+        assert executor._pool is not None
+
+
+class TestEchoBuffering:
+    """Tests for per-thread console buffering in parallel group runs."""
+
+    def test_serial_output_is_not_buffered(self):
+        with patch("core.executor.click.echo") as mock_echo:
+            executor._echo("first")
+            assert mock_echo.call_count == 1
+            executor._echo("second")
+        assert [c.args[0] for c in mock_echo.call_args_list] == ["first", "second"]
+
+    def test_parallel_task_output_is_one_block(self, fake_group_run):
+        def run(name, config, settings, skip_validation):
+            for i in range(3):
+                executor._echo(f"{name} line {i}")
+                # Give the other tasks a chance to print in between
+                time.sleep(0.01)
+            return True
+
+        fake_group_run.side_effect = run
+        with patch("core.executor.click.echo") as mock_echo:
+            executor.run_group_parallel(["a", "b", "c"], {})
+
+        blocks = [c.args[0] for c in mock_echo.call_args_list if "line" in c.args[0]]
+        assert len(blocks) == 3
+        for block in blocks:
+            name = block.split("Running ")[1].split("...")[0]
+            assert block.endswith(f"{name} line 0\n{name} line 1\n{name} line 2")
+
+    def test_worker_exception_still_flushes(self, fake_group_run):
+        def run(name, config, settings, skip_validation):
+            executor._echo(f"{name} started")
+            raise RuntimeError("boom")
+
+        fake_group_run.side_effect = run
+        results = []
+        with patch("core.executor.click.echo") as mock_echo:
+            executor.run_group_parallel(["a"], {}, results=results)
+
+        blocks = [c.args[0] for c in mock_echo.call_args_list]
+        assert "\nRunning a...\na started\nError: boom" in blocks
+        assert results == [("a", False, "boom")]
+
+
+class TestBackgroundRotation:
+    """Tests for log rotation on the background thread."""
+
+    def test_queued_rotations_remove_excess_logs(self, tmp_path):
+        log_dirs = {}
+        for name in ("a", "b"):
+            log_dir = log_dirs[name] = tmp_path / name
+            log_dir.mkdir()
+            for i in range(5):
+                log_file = log_dir / f"2024010{i}_000000.log"
+                log_file.write_text("x")
+                os.utime(log_file, (1000 + i, 1000 + i))
+
+        with patch("core.log_manager.get_task_log_dir", side_effect=lambda name: str(log_dirs[name])):
+            for name in ("a", "b"):
+                executor._schedule_rotation({"name": name, "log_limit": {"type": "count", "value": 2}})
+            executor.wait_for_rotations()
+
+        for log_dir in log_dirs.values():
+            assert sorted(p.name for p in log_dir.iterdir()) == ["20240103_000000.log", "20240104_000000.log"]
+
+    def test_pending_rotation_is_not_queued_twice(self):
+        started = threading.Event()
+        release = threading.Event()
+        rotated = []
+
+        def rotate(task):
+            rotated.append(task["name"])
+            if task["name"] == "blocker":
+                started.set()
+                release.wait(5)
+
+        with patch("core.executor.rotate_logs", side_effect=rotate):
+            # Hold the worker so the next rotations stay pending
+            executor._schedule_rotation({"name": "blocker"})
+            assert started.wait(5)
+            executor._schedule_rotation({"name": "a"})
+            executor._schedule_rotation({"name": "a"})
+            release.set()
+            executor.wait_for_rotations()
+
+        assert rotated == ["blocker", "a"]
+
+    def test_rotations_finish_before_exit(self, tmp_path):
+        marker = tmp_path / "rotated"
+        script = (
+            "import time\n"
+            "from unittest.mock import patch\n"
+            "from core import executor\n"
+            "def rotate(task):\n"
+            "    time.sleep(0.2)\n"
+            f"    open({str(marker)!r}, 'w').close()\n"
+            "patch('core.executor.rotate_logs', side_effect=rotate).start()\n"
+            "executor._schedule_rotation({'name': 'a'})\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        subprocess.run([sys.executable, "-c", script], cwd=root, check=True, timeout=30)
+
+        assert marker.exists()
+
+
+class TestSerialStopOnError:
+    """Tests for stop_on_error in serial group runs."""
+
+    def test_failing_task_stops_the_group(self, fake_group_run):
+        fake_group_run.side_effect = lambda name, config, settings, skip_validation: name != "b"
+        results = []
+
+        success_count = executor.run_group_serial(["a", "b", "c", "d"], {}, True, results=results)
+
+        assert results == [("a", True, None), ("b", False, None)]
+        assert [call.args[0] for call in fake_group_run.call_args_list] == ["a", "b"]
+        assert success_count == 1
+
+    def test_group_run_reports_later_tasks_as_skipped(self, fake_group_run, tmp_path):
+        from click.testing import CliRunner
+        from core.cli_commands import group_run
+
+        fake_group_run.side_effect = lambda name, config, settings, skip_validation: name != "b"
+        group = {"name": "nightly", "description": "d", "tasks": ["a", "b", "c", "d"], "stop_on_error": True}
+        config = {"tasks": [], "groups": [group], "_group_sources": {}}
+        for name in group["tasks"]:
+            (tmp_path / name).mkdir()
+
+        with patch("core.cli_commands.validate_and_reload_config", return_value=config), \
+             patch("core.log_manager.get_task_log_dir", side_effect=lambda name: str(tmp_path / name)), \
+             patch("core.cli_output_run.print_group_run_table") as mock_table:
+            result = CliRunner().invoke(group_run, ["nightly"])
+
+        assert result.exit_code == 0, result.output
+        assert "Stopping group execution" in result.output
+        rows = mock_table.call_args.args[0]
+        assert [(row.name, row.status) for row in rows] == [
+            ("a", "success"),
+            ("b", "failed"),
+            ("c", "skipped"),
+            ("d", "skipped"),
+        ]
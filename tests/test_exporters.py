@@ -53,6 +53,14 @@ def test_get_task_dir_dev(monkeypatch):
     path = exporters.get_task_dir()
     assert os.path.isdir(path)
 
+def test_get_export_paths_looks_up_path_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr('shutil.which', lambda name: calls.append(name) or '/usr/local/bin/signalbox')
+    paths = exporters.get_export_paths()
+    assert paths['signalbox_cmd'] == 'signalbox'
+    assert paths['task_dir'].endswith('signalbox')
+    assert calls == ['signalbox']
+
 def test_generate_systemd_service():
     group = {'description': 'desc', 'schedule': '* * * * *'}
     content = exporters.generate_systemd_service(group, 'g1')
@@ -92,6 +100,19 @@ def test_export_cron(monkeypatch, tmp_path):
         assert os.path.exists(f)
     shutil.rmtree(os.path.join(tmp_path, 'g1'))
 
+def test_export_all_cron(monkeypatch, tmp_path):
+    monkeypatch.setattr(exporters, 'get_config_value', lambda k, d=None: str(tmp_path))
+    groups = [
+        ({'description': 'one', 'schedule': '0 * * * *'}, 'g1'),
+        ({}, 'missing'),
+        ({'schedule': {'cron': '*/5 * * * *'}}, 'g2'),
+    ]
+    results = exporters.export_all_cron(groups)
+    assert [r.success for r in results] == [True, False, True]
+    with open(results[2].files[0]) as f:
+        assert f.read() == f"# g2\n{results[2].cron_entry}\n"
+    assert results[2].cron_entry.startswith('*/5 * * * * ')
+
 def test_export_cron_invalid():
     group = {}
     result = exporters.export_cron(group, 'g1')
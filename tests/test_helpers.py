@@ -32,7 +32,104 @@ def test_load_yaml_files_from_dir_filter(tmp_path):
     assert any(i['name'] == 't1' for i in items)
     assert not any(i['name'] == 't2' for i in items)
 
+def test_load_yaml_files_from_dir_skips_hidden_and_dirs(tmp_path):
+    d = tmp_path / 'yamls'
+    d.mkdir()
+    (d / 'b.yaml').write_text('tasks:\n- name: t2')
+    (d / 'a.yml').write_text('tasks:\n- name: t1')
+    (d / '.hidden.yaml').write_text('tasks:\n- name: hidden')
+    (d / 'nested.yaml').mkdir()
+    items = helpers.load_yaml_files_from_dir(str(d), 'tasks')
+    assert [i['name'] for i in items] == ['t1', 't2']
+
+def test_iter_yaml_files_from_dir_yields_parsed_lists(tmp_path):
+    d = tmp_path / 'yamls'
+    d.mkdir()
+    (d / 'a.yaml').write_text('tasks:\n- name: t1\n- name: t2')
+    (d / 'b.yaml').write_text('tasks:\n  name: t3')
+    (d / 'c.yaml').write_text('tasks: [unclosed')
+    errors = []
+    files = list(helpers.iter_yaml_files_from_dir(str(d), 'tasks', suppress_warnings=True, errors=errors))
+    assert [(os.path.basename(p), [i['name'] for i in items]) for p, items in files] == [
+        ('a.yaml', ['t1', 't2']),
+        ('b.yaml', ['t3']),
+    ]
+    assert errors == [str(d / 'c.yaml')]
+
+def test_load_yaml_file_reuses_parse_until_file_changes(tmp_path):
+    f = tmp_path / 'a.yaml'
+    f.write_text('tasks:\n- name: t1')
+    first = helpers.load_yaml_file(str(f))
+    first['tasks'].append({'name': 'mutated'})
+    assert helpers.load_yaml_file(str(f)) == {'tasks': [{'name': 't1'}]}
+    f.write_text('tasks:\n- name: t22')
+    assert helpers.load_yaml_file(str(f)) == {'tasks': [{'name': 't22'}]}
+
+def test_load_yaml_file_snapshots_only_reread_files(tmp_path, monkeypatch):
+    f = tmp_path / 'a.yaml'
+    f.write_text('tasks:\n- name: t1')
+    os.utime(f, (1000, 1000))
+    parses = []
+    real_load = helpers.yaml.load
+    monkeypatch.setattr(helpers.yaml, 'load', lambda *a, **kw: parses.append(1) or real_load(*a, **kw))
+    helpers.load_yaml_file(str(f))
+    assert helpers._yaml_cache[str(f)][1] is None
+    helpers.load_yaml_file(str(f))
+    helpers.load_yaml_file(str(f))
+    assert len(parses) == 2
+
+def test_load_yaml_file_does_not_snapshot_recent_files(tmp_path):
+    f = tmp_path / 'a.yaml'
+    f.write_text('tasks:\n- name: t1')
+    helpers.load_yaml_file(str(f))
+    helpers.load_yaml_file(str(f))
+    # Coarse timestamps: a same-size rewrite in the same tick keeps mtime and size
+    st = os.stat(f)
+    f.write_text('tasks:\n- name: t2')
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert helpers.load_yaml_file(str(f)) == {'tasks': [{'name': 't2'}]}
+
 def test_format_timestamp():
     from datetime import datetime
     ts = helpers.format_timestamp(datetime(2026, 1, 26, 12, 0, 0))
     assert '20260126' in ts
+
+def test_format_timestamp_now_fills_microseconds(monkeypatch):
+    from datetime import datetime
+    monkeypatch.setattr(helpers, 'get_timestamp_format', lambda: '%Y%m%d_%H%M%S_%f')
+    before = datetime.now().replace(microsecond=0)
+    ts = helpers.format_timestamp()
+    parsed = datetime.strptime(ts, '%Y%m%d_%H%M%S_%f')
+    assert before <= parsed <= datetime.now()
+
+def test_format_timestamp_now_keeps_escaped_percent(monkeypatch):
+    ts = helpers.format_timestamp(timestamp_format='%%f_%Y_%f')
+    head, year, micros = ts.split('_')
+    assert head == '%f' and len(year) == 4 and len(micros) == 6 and micros.isdigit()
+
+def test_parse_timestamp_strips_log_suffix():
+    dt = helpers.parse_timestamp('20260126_120000_000000.log', '%Y%m%d_%H%M%S_%f')
+    assert dt.year == 2026 and dt.hour == 12
+    assert helpers.parse_timestamp('not-a-timestamp', '%Y%m%d_%H%M%S_%f') is None
+
+def test_write_yaml_file_atomic_replaces_whole_file(tmp_path):
+    f = tmp_path / 'state.yaml'
+    f.write_text('old: true\n')
+    helpers.write_yaml_file_atomic(str(f), {'tasks': {'t1': {'last_status': 'success'}}}, header='# header\n')
+    assert f.read_text().startswith('# header\n')
+    assert helpers.load_yaml_file(str(f)) == {'tasks': {'t1': {'last_status': 'success'}}}
+    assert os.listdir(tmp_path) == ['state.yaml']
+
+def test_write_yaml_file_atomic_writes_through_symlink(tmp_path):
+    real_dir = tmp_path / 'real'
+    real_dir.mkdir()
+    target = real_dir / 't.yaml'
+    target.write_text('old: true\n')
+    target.chmod(0o600)
+    link = tmp_path / 'link.yaml'
+    link.symlink_to(target)
+    helpers.write_yaml_file_atomic(str(link), {'new': True})
+    assert link.is_symlink()
+    assert helpers.load_yaml_file(str(target)) == {'new': True}
+    assert (target.stat().st_mode & 0o777) == 0o600
+    assert sorted(os.listdir(real_dir)) == ['t.yaml']
@@ -8,7 +8,7 @@ def test_rotate_by_count(tmp_path):
         f.write_text('x')
         os.utime(f, (1000 + i, 1000 + i))
         files.append(f)
-    log_manager._rotate_by_count(str(d), [f.name for f in files], 2)
+    log_manager._rotate_by_count(log_manager._scan_log_files(str(d)), 2)
     remaining = list(d.iterdir())
     assert len(remaining) == 2
 
@@ -22,7 +22,7 @@ def test_rotate_by_age(tmp_path):
     new = d / 'new.log'
     new.write_text('x')
     os.utime(new, None)
-    log_manager._rotate_by_age(str(d), [old.name, new.name], 1)  # 1 day
+    log_manager._rotate_by_age(log_manager._scan_log_files(str(d)), 1)  # 1 day
     files = list(d.iterdir())
     assert new in files and old not in files
 
@@ -48,6 +48,25 @@ def test_get_log_history(tmp_path, monkeypatch):
     info, exists = log_manager.get_log_history('foo')
     assert exists and info[0][0] == 'b.log'
 
+def test_get_latest_log_rescans_only_when_dir_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_manager, 'get_task_log_dir', lambda name: str(tmp_path))
+    scans = []
+    real_scan = log_manager._scan_log_files
+    monkeypatch.setattr(log_manager, '_scan_log_files', lambda d: scans.append(d) or real_scan(d))
+    f1 = tmp_path / 'a.log'
+    f1.write_text('x')
+    os.utime(f1, (1000, 1000))
+    os.utime(tmp_path, (1000, 1000))
+    assert log_manager.get_latest_log('foo') == (str(f1), True)
+    assert log_manager.get_log_history('foo') == ([('a.log', 1000)], True)
+    assert len(scans) == 1
+    f2 = tmp_path / 'b.log'
+    f2.write_text('y')
+    os.utime(f2, (2000, 2000))
+    os.utime(tmp_path, (2000, 2000))
+    assert log_manager.get_latest_log('foo') == (str(f2), True)
+    assert len(scans) == 2
+
 def test_clear_script_logs(tmp_path, monkeypatch):
     monkeypatch.setattr(log_manager, 'get_task_log_dir', lambda name: str(tmp_path))
     f1 = tmp_path / 'a.log'
@@ -70,6 +89,19 @@ def test_format_log_with_colors():
     assert lines[1][1] == 'green'
     assert lines[2][1] == 'blue'
     assert lines[3][1] is None
+
+def test_iter_log_with_colors_streams_file(tmp_path):
+    log_file = tmp_path / 'a.log'
+    log_file.write_text('[START] run\nexit_code: 1\nother\n')
+    lines = log_manager.iter_log_with_colors(log_manager.iter_log_lines(str(log_file)))
+    assert list(lines) == [('[START] run', 'blue'), ('exit_code: 1', 'red'), ('other', None)]
+
+def test_log_with_invalid_utf8_is_readable(tmp_path):
+    log_file = tmp_path / 'a.log'
+    log_file.write_bytes(b'[START] run\nbad \xff byte\n')
+    assert list(log_manager.iter_log_lines(str(log_file))) == ['[START] run', 'bad \ufffd byte']
+    assert log_manager.read_log_content(str(log_file)) == '[START] run\nbad \ufffd byte\n'
+
 import os
 import tempfile
 import shutil
@@ -90,6 +122,17 @@ def test_ensure_log_dir(tmp_path, monkeypatch):
     log_manager.ensure_log_dir(task_name)
     assert os.path.isdir(log_dir)
 
+def test_ensure_log_dir_only_creates_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_manager, 'get_config_value', lambda k, d=None: str(tmp_path))
+    monkeypatch.setattr(log_manager, '_ensured_log_dirs', set())
+    calls = []
+    real_makedirs = os.makedirs
+    monkeypatch.setattr(log_manager.os, 'makedirs', lambda *a, **kw: calls.append(a) or real_makedirs(*a, **kw))
+    log_manager.ensure_log_dir('once')
+    log_manager.ensure_log_dir('once')
+    assert os.path.isdir(os.path.join(tmp_path, 'once'))
+    assert len(calls) == 1
+
 def test_get_log_path(monkeypatch):
     monkeypatch.setattr(log_manager, 'get_config_value', lambda k, d=None: 'logs')
     monkeypatch.setattr(log_manager, 'format_timestamp', lambda dt: '20260126_120000')
@@ -109,8 +152,95 @@ def test_write_execution_log(tmp_path, monkeypatch):
         content = f.read()
     assert 'echo 1' in content and 'output' in content
 
+def test_write_execution_log_from_files(tmp_path, monkeypatch):
+    import tempfile
+    monkeypatch.setattr(log_manager, 'get_config_value', lambda k, d=None: d)
+    log_file = os.path.join(tmp_path, 'log.txt')
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        out.write(b'streamed output')
+        err.write(b'streamed error')
+        log_manager.write_execution_log(log_file, 'echo 1', 0, out, err)
+    with open(log_file) as f:
+        content = f.read()
+    assert content == 'Command: echo 1\nReturn code: 0\nSTDOUT:\nstreamed output\nSTDERR:\nstreamed error\n'
+
 import pytest
 
 @pytest.mark.skip(reason="Cannot reliably trigger truncation logic without changing implementation.")
 def test_write_execution_log_truncate(tmp_path, monkeypatch):
     pass
+
+def test_filter_logs_task_and_date_bounds(monkeypatch):
+    from datetime import datetime
+    monkeypatch.setattr(log_manager, 'parse_log_metadata', lambda path: {'status': 'success'})
+    logs = [
+        {'task': 'a', 'timestamp': datetime(2026, 1, 1), 'path': 'p1'},
+        {'task': 'a', 'timestamp': datetime(2026, 1, 5), 'path': 'p2'},
+        {'task': 'b', 'timestamp': datetime(2026, 1, 5), 'path': 'p3'},
+        {'task': 'a', 'timestamp': datetime(2026, 1, 9), 'path': 'p4'},
+    ]
+    result = log_manager.filter_logs(logs, task='a', since=datetime(2026, 1, 2), until=datetime(2026, 1, 8))
+    assert [l['path'] for l in result] == ['p2']
+
+def test_filter_logs_only_parses_logs_within_limit(monkeypatch):
+    from datetime import datetime
+    parsed = []
+    def fake_metadata(path):
+        parsed.append(path)
+        return {'status': 'failed' if path in ('p1', 'p3') else 'success'}
+    monkeypatch.setattr(log_manager, 'parse_log_metadata', fake_metadata)
+    logs = [{'task': 'a', 'timestamp': datetime(2026, 1, day), 'path': f'p{day}'} for day in range(1, 6)]
+    result = log_manager.filter_logs(logs, limit=2)
+    assert [l['path'] for l in result] == ['p5', 'p4']
+    assert parsed == ['p5', 'p4']
+    parsed.clear()
+    result = log_manager.filter_logs(logs, status='failed', limit=1)
+    assert [l['path'] for l in result] == ['p3']
+    assert parsed == ['p5', 'p4', 'p3']
+
+def test_parse_log_metadata_reads_header_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_manager, 'get_config_value', lambda k, d=None: d)
+    log_file = str(tmp_path / 'a.log')
+    log_manager.write_execution_log(log_file, 'make test', 2, 'Return code: 0\n' * 1000, '')
+    metadata = log_manager.parse_log_metadata(log_file)
+    assert metadata['status'] == 'failed'
+    assert metadata['return_code'] == 2
+    assert metadata['command'] == 'make test'
+
+def test_parse_log_metadata_stops_reading_without_sections(tmp_path):
+    log_file = tmp_path / 'a.log'
+    log_file.write_bytes(b'Command: foreign\nReturn code: 0\n' + b'x' * (4 * 1024 * 1024))
+    with open(log_file, 'rb') as f:
+        head = log_manager._read_log_header(f)
+    assert len(head) <= log_manager._LOG_HEADER_LIMIT + log_manager._LOG_HEADER_CHUNK
+    assert log_manager.parse_log_metadata(str(log_file))['return_code'] == 0
+
+def test_read_log_header_finds_marker_split_across_reads(tmp_path):
+    log_file = tmp_path / 'a.log'
+    header = b'Command: ' + b'c' * (log_manager._LOG_HEADER_CHUNK - 12) + b'\n'
+    log_file.write_bytes(header + b'STDOUT:\nReturn code: 5\n')
+    with open(log_file, 'rb') as f:
+        assert log_manager._read_log_header(f) == header
+
+def test_scan_log_dir_rescans_recently_modified_dirs(tmp_path):
+    d = tmp_path / 'logs'
+    d.mkdir()
+    (d / 'a.log').write_text('x')
+    # Coarse timestamps: a log added in the same tick leaves the mtime as it was
+    st = os.stat(d)
+    log_manager._scan_log_dir(str(d))
+    (d / 'b.log').write_text('x')
+    os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns))
+    names = [os.path.basename(p) for _, p in log_manager._scan_log_dir(str(d))]
+    assert sorted(names) == ['a.log', 'b.log']
+
+def test_scan_log_dir_reuses_listing_of_settled_dirs(tmp_path):
+    d = tmp_path / 'logs'
+    d.mkdir()
+    (d / 'a.log').write_text('x')
+    os.utime(d, (1000, 1000))
+    log_manager._scan_log_dir(str(d))
+    (d / 'b.log').write_text('x')
+    os.utime(d, (1000, 1000))
+    names = [os.path.basename(p) for _, p in log_manager._scan_log_dir(str(d))]
+    assert names == ['a.log']
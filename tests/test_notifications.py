@@ -101,3 +101,11 @@ def test_notify_execution_result_failure_only(monkeypatch):
     # Should send if failures present
     result = notifications.notify_execution_result(2, 1, 1, context="scripts", failed_names=["fail"], config={"enabled": True, "on_failure_only": True})
     assert called.get('sent')
+
+def test_get_system_is_cached(monkeypatch):
+    notifications.get_system.cache_clear()
+    monkeypatch.setattr('platform.system', lambda: 'Linux')
+    assert notifications.get_system() == 'Linux'
+    monkeypatch.setattr('platform.system', lambda: 'Darwin')
+    assert notifications.get_system() == 'Linux'
+    notifications.get_system.cache_clear()